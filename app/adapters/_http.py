@@ -0,0 +1,47 @@
+"""
+Shared aiohttp session for REST adapters.
+"""
+from typing import Optional
+import aiohttp
+import logging
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide ClientSession, creating it lazily.
+
+    One session per process means one DNS cache and one set of per-host
+    connection pools even when several adapters run concurrently.
+    Adapters must not close this session in disconnect(); call
+    close_shared_session() at process shutdown instead.
+    """
+    global _session
+    if _session is None or _session.closed:
+        # Keep connections warm: aiohttp's default keepalive pool evicts
+        # after 15s, forcing a fresh TCP+TLS handshake on idle exchanges.
+        connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=50,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            force_close=False
+        )
+        timeout = aiohttp.ClientTimeout(total=30, connect=5, sock_read=10)
+        _session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    return _session
+
+
+async def close_shared_session():
+    """Close the shared session (process shutdown only)."""
+    global _session
+    if _session and not _session.closed:
+        await _session.close()
+        logger.info("Closed shared HTTP session")
+    _session = None
@@ -5,17 +5,44 @@ from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
 import hmac
-import hashlib
 import time
+import orjson
 import aiohttp
+import numpy as np
 from urllib.parse import urlencode
 from app.adapters.exchange_base import ExchangeAdapter
-from app.core.models import MarketData, OrderRequest, OrderFill
+from app.adapters._http import get_shared_session
+from app.core.models import MarketData, OrderRequest, OrderFill, OHLCVArrays
 from app.core.enums import OrderStatus, Side, OrderType
 import logging
 
 logger = logging.getLogger(__name__)
 
+_STATUS_MAP = {
+    "NEW": OrderStatus.OPEN,
+    "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELED": OrderStatus.CANCELLED,
+    "PENDING_CANCEL": OrderStatus.OPEN,
+    "REJECTED": OrderStatus.REJECTED,
+    "EXPIRED": OrderStatus.EXPIRED
+}
+
+# Decimal is immutable, so sharing these across calls is safe
+_DECIMAL_ZERO = Decimal("0")
+_FEES = (Decimal("0.001"), Decimal("0.001"))  # 0.1% maker/taker
+_MIN_NOTIONAL = Decimal("10")
+_LOT_SIZE = Decimal("0.00001")
+
+_INTERVAL_MAP = {
+    "1m": "1m",
+    "5m": "5m",
+    "15m": "15m",
+    "1h": "1h",
+    "4h": "4h",
+    "1d": "1d"
+}
+
 
 class BinanceAdapter(ExchangeAdapter):
     """Binance Spot API adapter."""
@@ -25,32 +52,45 @@ class BinanceAdapter(ExchangeAdapter):
     def __init__(self, api_key: str, api_secret: str):
         super().__init__(api_key, api_secret)
         self.session: Optional[aiohttp.ClientSession] = None
-
-    def _generate_signature(self, params: Dict) -> str:
-        """Generate request signature."""
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode(),
-            query_string.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        # API keys are ASCII; encode once instead of per-request
+        self._api_secret_bytes = api_secret.encode("ascii")
+        self._symbol_cache: Dict[str, str] = {}
+        self._balance_cache: Dict[str, Decimal] = {}
+        self._balance_cache_ts: float = 0.0
+
+    def _to_binance_symbol(self, symbol: str) -> str:
+        """Convert symbol to Binance format (BTC-USD -> BTCUSDT), memoized."""
+        binance_symbol = self._symbol_cache.get(symbol)
+        if binance_symbol is None:
+            binance_symbol = symbol.replace("-", "")
+            if binance_symbol.endswith("USD"):
+                binance_symbol += "T"
+            self._symbol_cache[symbol] = binance_symbol
+        return binance_symbol
 
     async def connect(self):
         """Connect."""
-        self.session = aiohttp.ClientSession()
+        self.session = get_shared_session()
         self.connected = True
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat = time.monotonic()
         logger.info("Connected to Binance")
 
     async def disconnect(self):
-        """Disconnect."""
-        if self.session:
-            await self.session.close()
+        """Disconnect (the shared session stays open for other adapters)."""
+        self.session = None
         self.connected = False
         logger.info("Disconnected from Binance")
 
     async def _request(self, method: str, endpoint: str, signed: bool = False, params: Optional[Dict] = None) -> Dict:
+        """Make request, coalescing concurrent duplicate GETs."""
+        if method == "GET":
+            # Key on the params themselves, not their hash — hash
+            # collisions would hand one caller another caller's response
+            key = (endpoint, tuple(sorted(params.items())) if params else ())
+            return await self._coalesce(key, lambda: self._do_request(method, endpoint, signed, params))
+        return await self._do_request(method, endpoint, signed, params)
+
+    async def _do_request(self, method: str, endpoint: str, signed: bool = False, params: Optional[Dict] = None) -> Dict:
         """Make request."""
         if not self.session:
             raise RuntimeError("Not connected")
@@ -58,24 +98,36 @@ class BinanceAdapter(ExchangeAdapter):
         url = f"{self.BASE_URL}{endpoint}"
         headers = {"X-MBX-APIKEY": self.api_key}
 
-        if params is None:
-            params = {}
-
         if signed:
-            params["timestamp"] = int(time.time() * 1000)
-            params["signature"] = self._generate_signature(params)
+            # Build the canonical query string once: sign it, then hand the
+            # pre-encoded URL to aiohttp so it isn't re-encoded (and the
+            # caller's params dict is never mutated — retries would otherwise
+            # re-sign with a stale signature field)
+            signed_params = dict(params) if params else {}
+            signed_params["timestamp"] = time.time_ns() // 1_000_000
+            query_string = urlencode(signed_params)
+            # HMAC-SHA256 is mandated by the Binance API — do not swap for a
+            # faster keyed hash (e.g. blake2b); auth would break
+            signature = hmac.digest(self._api_secret_bytes, query_string.encode(), "sha256").hex()
+            url = f"{url}?{query_string}&signature={signature}"
+            params = None
 
         async with self.session.request(method, url, headers=headers, params=params) as response:
-            self.last_heartbeat = datetime.utcnow()
-            response.raise_for_status()
-            return await response.json()
+            self.last_heartbeat = time.monotonic()
+            if response.status >= 400:
+                # Surface the exchange's error body instead of the bare reason
+                text = await response.text()
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history,
+                    status=response.status, message=text, headers=response.headers
+                )
+            # orjson parses large payloads (klines, trades) several times
+            # faster than stdlib json, and .read() skips content-type sniffing
+            return orjson.loads(await response.read())
 
     async def get_ticker(self, symbol: str) -> MarketData:
         """Get ticker."""
-        # Convert symbol: BTC-USD -> BTCUSDT for Binance
-        binance_symbol = symbol.replace("-", "")
-        if "USD" in binance_symbol and not "USDT" in binance_symbol:
-            binance_symbol = binance_symbol.replace("USD", "USDT")
+        binance_symbol = self._to_binance_symbol(symbol)
 
         data = await self._request("GET", "/api/v3/ticker/bookTicker", params={"symbol": binance_symbol})
 
@@ -88,48 +140,51 @@ class BinanceAdapter(ExchangeAdapter):
         )
 
     async def get_balance(self, asset: str) -> Decimal:
-        """Get balance."""
-        data = await self._request("GET", "/api/v3/account", signed=True)
+        """Get balance (served from a short-TTL account snapshot)."""
+        # One /account round-trip covers all assets; callers looking up
+        # N assets in quick succession share the same snapshot
+        if time.monotonic() - self._balance_cache_ts > 0.5:
+            self._balance_cache = await self.get_balances()
+            self._balance_cache_ts = time.monotonic()
 
-        for balance in data["balances"]:
-            if balance["asset"] == asset:
-                return Decimal(balance["free"])
-
-        return Decimal("0")
+        return self._balance_cache.get(asset, _DECIMAL_ZERO)
 
     async def get_balances(self) -> Dict[str, Decimal]:
         """Get all balances."""
         data = await self._request("GET", "/api/v3/account", signed=True)
 
+        # Binance returns 200+ assets, almost all "0.00000000" — skip the
+        # zero strings before paying for a Decimal construction each
         balances = {}
-        for balance in data["balances"]:
-            free = Decimal(balance["free"])
+        for b in data["balances"]:
+            s = b["free"]
+            if s == "0.00000000" or s == "0":
+                continue
+            free = Decimal(s)
             if free > 0:
-                balances[balance["asset"]] = free
+                balances[b["asset"]] = free
 
         return balances
 
     async def place_order(self, symbol: str, order: OrderRequest) -> str:
         """Place order."""
-        binance_symbol = symbol.replace("-", "")
-        if "USD" in binance_symbol and not "USDT" in binance_symbol:
-            binance_symbol = binance_symbol.replace("USD", "USDT")
+        binance_symbol = self._to_binance_symbol(symbol)
 
         params = {
             "symbol": binance_symbol,
             "side": order.side.value.upper(),
-            "quantity": str(float(order.qty))
+            "quantity": f"{order.qty:f}"
         }
 
         if order.order_type == OrderType.MARKET:
             params["type"] = "MARKET"
         elif order.order_type == OrderType.LIMIT:
             params["type"] = "LIMIT"
-            params["price"] = str(float(order.price))
+            params["price"] = f"{order.price:f}"
             params["timeInForce"] = "GTC"
         elif order.order_type == OrderType.POST_ONLY:
             params["type"] = "LIMIT_MAKER"
-            params["price"] = str(float(order.price))
+            params["price"] = f"{order.price:f}"
 
         if order.idempotency_key:
             params["newClientOrderId"] = order.idempotency_key
@@ -142,9 +197,7 @@ class BinanceAdapter(ExchangeAdapter):
     async def cancel_order(self, symbol: str, order_id: str) -> bool:
         """Cancel order."""
         try:
-            binance_symbol = symbol.replace("-", "")
-            if "USD" in binance_symbol and not "USDT" in binance_symbol:
-                binance_symbol = binance_symbol.replace("USD", "USDT")
+            binance_symbol = self._to_binance_symbol(symbol)
 
             await self._request("DELETE", "/api/v3/order", signed=True, params={
                 "symbol": binance_symbol,
@@ -159,26 +212,14 @@ class BinanceAdapter(ExchangeAdapter):
     async def get_order_status(self, symbol: str, order_id: str) -> OrderStatus:
         """Get order status."""
         try:
-            binance_symbol = symbol.replace("-", "")
-            if "USD" in binance_symbol and not "USDT" in binance_symbol:
-                binance_symbol = binance_symbol.replace("USD", "USDT")
+            binance_symbol = self._to_binance_symbol(symbol)
 
             data = await self._request("GET", "/api/v3/order", signed=True, params={
                 "symbol": binance_symbol,
                 "orderId": order_id
             })
 
-            status_map = {
-                "NEW": OrderStatus.OPEN,
-                "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
-                "FILLED": OrderStatus.FILLED,
-                "CANCELED": OrderStatus.CANCELLED,
-                "PENDING_CANCEL": OrderStatus.OPEN,
-                "REJECTED": OrderStatus.REJECTED,
-                "EXPIRED": OrderStatus.EXPIRED
-            }
-
-            return status_map.get(data["status"], OrderStatus.REJECTED)
+            return _STATUS_MAP.get(data["status"], OrderStatus.REJECTED)
 
         except Exception as e:
             logger.error(f"Failed to get order status: {e}")
@@ -193,9 +234,7 @@ class BinanceAdapter(ExchangeAdapter):
     async def get_open_orders(self, symbol: str) -> List[Dict]:
         """Get open orders."""
         try:
-            binance_symbol = symbol.replace("-", "")
-            if "USD" in binance_symbol and not "USDT" in binance_symbol:
-                binance_symbol = binance_symbol.replace("USD", "USDT")
+            binance_symbol = self._to_binance_symbol(symbol)
 
             return await self._request("GET", "/api/v3/openOrders", signed=True, params={
                 "symbol": binance_symbol
@@ -207,9 +246,7 @@ class BinanceAdapter(ExchangeAdapter):
     async def get_recent_trades(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get recent trades."""
         try:
-            binance_symbol = symbol.replace("-", "")
-            if "USD" in binance_symbol and not "USDT" in binance_symbol:
-                binance_symbol = binance_symbol.replace("USD", "USDT")
+            binance_symbol = self._to_binance_symbol(symbol)
 
             return await self._request("GET", "/api/v3/trades", params={
                 "symbol": binance_symbol,
@@ -219,6 +256,23 @@ class BinanceAdapter(ExchangeAdapter):
             logger.error(f"Failed to get trades: {e}")
             return []
 
+    def _ohlcv_params(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: Optional[datetime],
+        limit: int
+    ) -> Dict:
+        """Build kline request params."""
+        params = {
+            "symbol": self._to_binance_symbol(symbol),
+            "interval": _INTERVAL_MAP.get(timeframe, "1m"),
+            "limit": limit
+        }
+        if since:
+            params["startTime"] = int(since.timestamp() * 1000)
+        return params
+
     async def get_ohlcv(
         self,
         symbol: str,
@@ -228,58 +282,86 @@ class BinanceAdapter(ExchangeAdapter):
     ) -> List[Dict]:
         """Get OHLCV."""
         try:
-            binance_symbol = symbol.replace("-", "")
-            if "USD" in binance_symbol and not "USDT" in binance_symbol:
-                binance_symbol = binance_symbol.replace("USD", "USDT")
-
-            interval_map = {
-                "1m": "1m",
-                "5m": "5m",
-                "15m": "15m",
-                "1h": "1h",
-                "4h": "4h",
-                "1d": "1d"
-            }
-
-            params = {
-                "symbol": binance_symbol,
-                "interval": interval_map.get(timeframe, "1m"),
-                "limit": limit
-            }
-
-            if since:
-                params["startTime"] = int(since.timestamp() * 1000)
-
-            data = await self._request("GET", "/api/v3/klines", params=params)
-
-            candles = []
-            for candle in data:
-                candles.append({
-                    "timestamp": datetime.fromtimestamp(candle[0] / 1000),
-                    "open": float(candle[1]),
-                    "high": float(candle[2]),
-                    "low": float(candle[3]),
-                    "close": float(candle[4]),
-                    "volume": float(candle[5])
-                })
-
-            return candles
+            data = await self._request(
+                "GET", "/api/v3/klines",
+                params=self._ohlcv_params(symbol, timeframe, since, limit)
+            )
+
+            if not data:
+                return []
+
+            # Vectorize the numeric conversion: one C-level astype pass
+            # instead of five float() calls per candle
+            arr = np.asarray(data, dtype=object)
+            ohlcv = arr[:, 1:6].astype(np.float64).tolist()
+            # Convert the whole timestamp column at once; datetime64[ms]
+            # .tolist() yields datetimes without a per-row fromtimestamp call
+            timestamps = arr[:, 0].astype(np.int64).astype("datetime64[ms]").tolist()
+
+            return [
+                {
+                    "timestamp": ts,
+                    "open": o,
+                    "high": h,
+                    "low": l,
+                    "close": c,
+                    "volume": v
+                }
+                for ts, (o, h, l, c, v) in zip(timestamps, ohlcv)
+            ]
 
         except Exception as e:
             logger.error(f"Failed to get OHLCV: {e}")
             return []
 
+    async def get_ohlcv_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: Optional[datetime] = None,
+        limit: int = 100
+    ) -> OHLCVArrays:
+        """Get OHLCV columns built straight from the kline payload."""
+        try:
+            data = await self._request(
+                "GET", "/api/v3/klines",
+                params=self._ohlcv_params(symbol, timeframe, since, limit)
+            )
+
+            arr = np.asarray(data, dtype=object) if data else np.empty((0, 6), dtype=object)
+            cols = arr[:, 1:6].astype(np.float64)
+
+            return OHLCVArrays(
+                ts=arr[:, 0].astype(np.int64),
+                open=np.ascontiguousarray(cols[:, 0]),
+                high=np.ascontiguousarray(cols[:, 1]),
+                low=np.ascontiguousarray(cols[:, 2]),
+                close=np.ascontiguousarray(cols[:, 3]),
+                volume=np.ascontiguousarray(cols[:, 4])
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get OHLCV arrays: {e}")
+            return OHLCVArrays(
+                ts=np.empty(0, dtype=np.int64),
+                open=np.empty(0),
+                high=np.empty(0),
+                low=np.empty(0),
+                close=np.empty(0),
+                volume=np.empty(0)
+            )
+
     def get_fees(self) -> Tuple[Decimal, Decimal]:
         """Get fees."""
-        return (Decimal("0.001"), Decimal("0.001"))  # 0.1% maker/taker
+        return _FEES
 
     def get_min_notional(self, symbol: str) -> Decimal:
         """Get min notional."""
-        return Decimal("10")
+        return _MIN_NOTIONAL
 
     def get_lot_size(self, symbol: str) -> Decimal:
         """Get lot size."""
-        return Decimal("0.00001")
+        return _LOT_SIZE
 
     def get_price_precision(self, symbol: str) -> int:
         """Get price precision."""
@@ -5,17 +5,45 @@ from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
 import hmac
-import hashlib
 import time
-import json
+import orjson
 import aiohttp
+import numpy as np
 from app.adapters.exchange_base import ExchangeAdapter
+from app.adapters._http import get_shared_session
 from app.core.models import MarketData, OrderRequest, OrderFill
 from app.core.enums import OrderStatus, Side, OrderType
 import logging
 
 logger = logging.getLogger(__name__)
 
+_STATUS_MAP = {
+    "PENDING": OrderStatus.PENDING,
+    "OPEN": OrderStatus.OPEN,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELLED": OrderStatus.CANCELLED,
+    "EXPIRED": OrderStatus.EXPIRED,
+    "FAILED": OrderStatus.REJECTED,
+    "QUEUED": OrderStatus.PENDING
+}
+
+# Decimal is immutable, so sharing these across calls is safe
+_DECIMAL_ZERO = Decimal("0")
+_FEES = (Decimal("0.004"), Decimal("0.006"))  # 0.4% maker, 0.6% taker
+_MIN_NOTIONAL = Decimal("10")  # $10 minimum for Coinbase
+_BTC_LOT_SIZE = Decimal("0.00001")  # 0.00001 BTC
+_DEFAULT_LOT_SIZE = Decimal("0.01")
+
+# Timeframe -> granularity in seconds
+_GRANULARITY_MAP = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "6h": 21600,
+    "1d": 86400
+}
+
 
 class CoinbaseAdapter(ExchangeAdapter):
     """
@@ -28,56 +56,78 @@ class CoinbaseAdapter(ExchangeAdapter):
     def __init__(self, api_key: str, api_secret: str):
         super().__init__(api_key, api_secret)
         self.session: Optional[aiohttp.ClientSession] = None
+        # API keys are ASCII; encode once instead of per-request
+        self._api_secret_bytes = api_secret.encode("ascii")
+        self._base_headers = {
+            "CB-ACCESS-KEY": api_key,
+            "Content-Type": "application/json"
+        }
+        self._balance_cache: Dict[str, Decimal] = {}
+        self._balance_cache_ts: float = 0.0
 
-    def _generate_signature(self, timestamp: str, method: str, path: str, body: str = "") -> str:
+    def _generate_signature(self, timestamp: str, method: str, path: str, body: bytes = b"") -> str:
         """Generate request signature for Coinbase."""
-        message = f"{timestamp}{method}{path}{body}"
-        signature = hmac.new(
-            self.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
-
-    def _get_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
+        # HMAC-SHA256 is mandated by the Coinbase API — do not swap for a
+        # faster keyed hash (e.g. blake2b); auth would break.
+        # Assemble the message in bytes so the (potentially large) JSON body
+        # is never copied through an intermediate unicode string.
+        message = bytearray(timestamp.encode("ascii"))
+        message += method.encode("ascii")
+        message += path.encode("ascii")
+        if body:
+            message += body
+        return hmac.digest(self._api_secret_bytes, bytes(message), "sha256").hex()
+
+    def _get_headers(self, method: str, path: str, body: bytes = b"") -> Dict[str, str]:
         """Get headers for authenticated request."""
-        timestamp = str(int(time.time()))
-        signature = self._generate_signature(timestamp, method, path, body)
+        timestamp = str(time.time_ns() // 1_000_000_000)
 
-        return {
-            "CB-ACCESS-KEY": self.api_key,
-            "CB-ACCESS-SIGN": signature,
-            "CB-ACCESS-TIMESTAMP": timestamp,
-            "Content-Type": "application/json"
-        }
+        headers = self._base_headers.copy()
+        headers["CB-ACCESS-SIGN"] = self._generate_signature(timestamp, method, path, body)
+        headers["CB-ACCESS-TIMESTAMP"] = timestamp
+        return headers
 
     async def connect(self):
-        """Connect (create session)."""
-        self.session = aiohttp.ClientSession()
+        """Connect (attach to the shared session)."""
+        self.session = get_shared_session()
         self.connected = True
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat = time.monotonic()
         logger.info("Connected to Coinbase")
 
     async def disconnect(self):
-        """Disconnect."""
-        if self.session:
-            await self.session.close()
+        """Disconnect (the shared session stays open for other adapters)."""
+        self.session = None
         self.connected = False
         logger.info("Disconnected from Coinbase")
 
     async def _request(self, method: str, path: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict:
+        """Make authenticated request, coalescing concurrent duplicate GETs."""
+        if method == "GET":
+            # Key on the params themselves, not their hash — hash
+            # collisions would hand one caller another caller's response
+            key = (path, tuple(sorted(params.items())) if params else ())
+            return await self._coalesce(key, lambda: self._do_request(method, path, params, data))
+        return await self._do_request(method, path, params, data)
+
+    async def _do_request(self, method: str, path: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict:
         """Make authenticated request."""
         if not self.session:
             raise RuntimeError("Not connected")
 
         url = f"{self.BASE_URL}{path}"
-        body = json.dumps(data) if data else ""
-        headers = self._get_headers(method, path, body)
-
-        async with self.session.request(method, url, headers=headers, params=params, json=data) as response:
-            self.last_heartbeat = datetime.utcnow()
-            response.raise_for_status()
-            return await response.json()
+        body_bytes = orjson.dumps(data) if data else b""
+        headers = self._get_headers(method, path, body_bytes)
+
+        async with self.session.request(method, url, headers=headers, params=params, data=body_bytes or None) as response:
+            self.last_heartbeat = time.monotonic()
+            if response.status >= 400:
+                # Surface the exchange's error body instead of the bare reason
+                text = await response.text()
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history,
+                    status=response.status, message=text, headers=response.headers
+                )
+            return orjson.loads(await response.read())
 
     async def get_ticker(self, symbol: str) -> MarketData:
         """Get current market data."""
@@ -93,25 +143,28 @@ class CoinbaseAdapter(ExchangeAdapter):
         )
 
     async def get_balance(self, asset: str) -> Decimal:
-        """Get balance for asset."""
-        accounts = await self._request("GET", "/api/v3/brokerage/accounts")
+        """Get balance for asset (served from a short-TTL account snapshot)."""
+        # One /accounts round-trip covers all assets; callers looking up
+        # N assets in quick succession share the same snapshot
+        if time.monotonic() - self._balance_cache_ts > 0.5:
+            self._balance_cache = await self.get_balances()
+            self._balance_cache_ts = time.monotonic()
 
-        for account in accounts.get("accounts", []):
-            if account["currency"] == asset:
-                return Decimal(account["available_balance"]["value"])
-
-        return Decimal("0")
+        return self._balance_cache.get(asset, _DECIMAL_ZERO)
 
     async def get_balances(self) -> Dict[str, Decimal]:
         """Get all balances."""
         accounts = await self._request("GET", "/api/v3/brokerage/accounts")
 
+        # Skip zero-balance strings before paying for a Decimal construction
         balances = {}
         for account in accounts.get("accounts", []):
-            currency = account["currency"]
-            balance = Decimal(account["available_balance"]["value"])
+            s = account["available_balance"]["value"]
+            if s == "0" or s == "0.00":
+                continue
+            balance = Decimal(s)
             if balance > 0:
-                balances[currency] = balance
+                balances[account["currency"]] = balance
 
         return balances
 
@@ -123,26 +176,26 @@ class CoinbaseAdapter(ExchangeAdapter):
             if order.side == Side.BUY:
                 order_config = {
                     "market_market_ioc": {
-                        "quote_size": str(float(order.qty * order.price)) if order.price else str(float(order.qty))
+                        "quote_size": f"{(order.qty * order.price):f}" if order.price else f"{order.qty:f}"
                     }
                 }
             else:
                 order_config = {
                     "market_market_ioc": {
-                        "base_size": str(float(order.qty))
+                        "base_size": f"{order.qty:f}"
                     }
                 }
         elif order.order_type == OrderType.LIMIT or order.order_type == OrderType.POST_ONLY:
             order_config = {
                 "limit_limit_gtc" if order.order_type == OrderType.LIMIT else "limit_limit_gtd": {
-                    "base_size": str(float(order.qty)),
-                    "limit_price": str(float(order.price)),
+                    "base_size": f"{order.qty:f}",
+                    "limit_price": f"{order.price:f}",
                     "post_only": order.post_only
                 }
             }
 
         data = {
-            "client_order_id": order.idempotency_key or f"order_{int(time.time() * 1000)}",
+            "client_order_id": order.idempotency_key or f"order_{time.time_ns() // 1_000_000}",
             "product_id": symbol,
             "side": order.side.value.upper(),
             "order_configuration": order_config
@@ -170,17 +223,7 @@ class CoinbaseAdapter(ExchangeAdapter):
 
             status = data.get("order", {}).get("status", "").upper()
 
-            status_map = {
-                "PENDING": OrderStatus.PENDING,
-                "OPEN": OrderStatus.OPEN,
-                "FILLED": OrderStatus.FILLED,
-                "CANCELLED": OrderStatus.CANCELLED,
-                "EXPIRED": OrderStatus.EXPIRED,
-                "FAILED": OrderStatus.REJECTED,
-                "QUEUED": OrderStatus.PENDING
-            }
-
-            return status_map.get(status, OrderStatus.REJECTED)
+            return _STATUS_MAP.get(status, OrderStatus.REJECTED)
 
         except Exception as e:
             logger.error(f"Failed to get order status for {order_id}: {e}")
@@ -237,20 +280,8 @@ class CoinbaseAdapter(ExchangeAdapter):
     ) -> List[Dict]:
         """Get OHLCV candles."""
         try:
-            # Map timeframe to granularity in seconds
-            granularity_map = {
-                "1m": 60,
-                "5m": 300,
-                "15m": 900,
-                "1h": 3600,
-                "6h": 21600,
-                "1d": 86400
-            }
-
-            granularity = granularity_map.get(timeframe, 60)
-
             params = {
-                "granularity": granularity,
+                "granularity": _GRANULARITY_MAP.get(timeframe, 60),
             }
 
             if since:
@@ -259,16 +290,31 @@ class CoinbaseAdapter(ExchangeAdapter):
 
             data = await self._request("GET", f"/api/v3/brokerage/products/{symbol}/candles", params=params)
 
-            candles = []
-            for candle in data.get("candles", [])[:limit]:
-                candles.append({
-                    "timestamp": datetime.fromtimestamp(int(candle["start"])),
-                    "open": float(candle["open"]),
-                    "high": float(candle["high"]),
-                    "low": float(candle["low"]),
-                    "close": float(candle["close"]),
-                    "volume": float(candle["volume"])
-                })
+            raw = data.get("candles", [])[:limit]
+            if not raw:
+                return []
+
+            # Vectorize the numeric conversion: one C-level astype pass
+            # instead of five float() calls per candle
+            ohlcv = np.array(
+                [(c["open"], c["high"], c["low"], c["close"], c["volume"]) for c in raw],
+                dtype=np.float64
+            ).tolist()
+            # UTC-naive per the get_ohlcv contract; fromtimestamp would
+            # shift by the host timezone
+            timestamps = [datetime.utcfromtimestamp(int(c["start"])) for c in raw]
+
+            candles = [
+                {
+                    "timestamp": ts,
+                    "open": o,
+                    "high": h,
+                    "low": l,
+                    "close": c,
+                    "volume": v
+                }
+                for ts, (o, h, l, c, v) in zip(timestamps, ohlcv)
+            ]
 
             return sorted(candles, key=lambda x: x["timestamp"])
 
@@ -279,17 +325,17 @@ class CoinbaseAdapter(ExchangeAdapter):
     def get_fees(self) -> Tuple[Decimal, Decimal]:
         """Get fees (Coinbase Advanced defaults)."""
         # These can vary by volume tier
-        return (Decimal("0.004"), Decimal("0.006"))  # 0.4% maker, 0.6% taker
+        return _FEES
 
     def get_min_notional(self, symbol: str) -> Decimal:
         """Get minimum notional."""
-        return Decimal("10")  # $10 minimum for Coinbase
+        return _MIN_NOTIONAL
 
     def get_lot_size(self, symbol: str) -> Decimal:
         """Get lot size."""
         if "BTC" in symbol:
-            return Decimal("0.00001")  # 0.00001 BTC
-        return Decimal("0.01")
+            return _BTC_LOT_SIZE
+        return _DEFAULT_LOT_SIZE
 
     def get_price_precision(self, symbol: str) -> int:
         """Get price precision."""
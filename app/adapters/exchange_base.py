@@ -2,12 +2,14 @@
 Base exchange adapter interface.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
-from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN
 from datetime import datetime
-from app.core.models import MarketData, OrderRequest, OrderFill
+from app.core.models import MarketData, OrderRequest, OrderFill, OHLCVArrays
+import numpy as np
 from app.core.enums import OrderStatus
 import asyncio
+import time
 
 
 class ExchangeAdapter(ABC):
@@ -17,7 +19,11 @@ class ExchangeAdapter(ABC):
         self.api_key = api_key
         self.api_secret = api_secret
         self.connected = False
-        self.last_heartbeat: Optional[datetime] = None
+        # Monotonic timestamp of the last exchange response (0.0 = never)
+        self.last_heartbeat: float = 0.0
+        self._price_quantum_cache: Dict[str, Decimal] = {}
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._order_update_callbacks: List[Callable[[str, OrderStatus, Optional[OrderFill], Optional[str]], None]] = []
 
     @abstractmethod
     async def connect(self):
@@ -87,10 +93,38 @@ class ExchangeAdapter(ABC):
     ) -> List[Dict]:
         """
         Get OHLCV candles.
-        Returns list of dicts with keys: timestamp, open, high, low, close, volume
+        Returns list of dicts with keys: timestamp, open, high, low, close, volume.
+        `timestamp` is a UTC-naive datetime, matching the utcnow()-based
+        timestamps used throughout the rest of the system.
         """
         pass
 
+    async def get_ohlcv_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: Optional[datetime] = None,
+        limit: int = 100
+    ) -> OHLCVArrays:
+        """
+        Get OHLCV candles in column (structure-of-arrays) layout for
+        vectorized indicator math. Adapters may override with a path that
+        builds the arrays straight from the exchange payload.
+        """
+        candles = await self.get_ohlcv(symbol, timeframe, since=since, limit=limit)
+        n = len(candles)
+        return OHLCVArrays(
+            ts=np.fromiter(
+                (int(c["timestamp"].timestamp() * 1000) for c in candles),
+                dtype=np.int64, count=n
+            ),
+            open=np.fromiter((c["open"] for c in candles), dtype=np.float64, count=n),
+            high=np.fromiter((c["high"] for c in candles), dtype=np.float64, count=n),
+            low=np.fromiter((c["low"] for c in candles), dtype=np.float64, count=n),
+            close=np.fromiter((c["close"] for c in candles), dtype=np.float64, count=n),
+            volume=np.fromiter((c["volume"] for c in candles), dtype=np.float64, count=n)
+        )
+
     @abstractmethod
     def get_fees(self) -> Tuple[Decimal, Decimal]:
         """
@@ -114,27 +148,68 @@ class ExchangeAdapter(ABC):
         """Get price precision (decimal places)."""
         pass
 
+    def subscribe_order_updates(
+        self,
+        callback: Callable[[str, OrderStatus, Optional[OrderFill], Optional[str]], None]
+    ) -> bool:
+        """
+        Register a callback for pushed order updates.
+
+        Adapters that stream order events call the callback with
+        (order_id, status, fill, client_key) whenever an order reaches a
+        terminal state; client_key echoes the caller's idempotency key so
+        waiters can be registered before the exchange order id is known.
+        Returns True if this adapter pushes updates; adapters that only
+        support REST return False and callers fall back to polling.
+        """
+        return False
+
+    def _push_order_update(
+        self,
+        order_id: str,
+        status: OrderStatus,
+        fill: Optional[OrderFill],
+        client_key: Optional[str] = None
+    ):
+        """Deliver an order update to all registered callbacks."""
+        for callback in self._order_update_callbacks:
+            try:
+                callback(order_id, status, fill, client_key)
+            except Exception:
+                # A broken subscriber must not poison order processing
+                pass
+
+    async def _coalesce(self, key: tuple, coro_factory) -> Dict:
+        """
+        Share one network round-trip between concurrent duplicate requests.
+
+        Only safe for idempotent reads (ticker, balances, status, OHLCV) —
+        never route order placement or cancellation through this.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await task
+
     async def health_check(self) -> bool:
         """
         Check if exchange connection is healthy.
         Returns True if healthy, False otherwise.
         """
-        if not self.connected:
-            return False
-
-        if self.last_heartbeat is None:
-            return False
-
         # Check if last heartbeat was within acceptable time
-        time_since_heartbeat = (datetime.utcnow() - self.last_heartbeat).total_seconds()
-        return time_since_heartbeat < 10  # 10 seconds threshold
+        return self.connected and (time.monotonic() - self.last_heartbeat) < 10
 
     def round_price(self, symbol: str, price: Decimal) -> Decimal:
         """Round price to exchange precision."""
-        precision = self.get_price_precision(symbol)
-        return Decimal(str(round(float(price), precision)))
+        quantum = self._price_quantum_cache.get(symbol)
+        if quantum is None:
+            quantum = Decimal(1).scaleb(-self.get_price_precision(symbol))
+            self._price_quantum_cache[symbol] = quantum
+        return price.quantize(quantum, rounding=ROUND_HALF_EVEN)
 
     def round_quantity(self, symbol: str, qty: Decimal) -> Decimal:
         """Round quantity to exchange lot size."""
         lot_size = self.get_lot_size(symbol)
-        return (qty // lot_size) * lot_size
+        return qty.quantize(lot_size, rounding=ROUND_DOWN)
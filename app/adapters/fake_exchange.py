@@ -1,75 +1,131 @@
 """
 Fake exchange adapter for testing and paper trading.
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict, deque
+from itertools import islice
 from decimal import Decimal
 from datetime import datetime, timedelta
-import uuid
+import os
 import asyncio
+import heapq
+import time
+import numpy as np
 from app.adapters.exchange_base import ExchangeAdapter
 from app.core.models import MarketData, OrderRequest, OrderFill
 from app.core.enums import OrderStatus, Side, OrderType
 import random
 
 
+def _to_decimal(value: float) -> Decimal:
+    """Convert internal float state to Decimal at the API boundary."""
+    return Decimal(str(value))
+
+
 class FakeExchange(ExchangeAdapter):
     """
     Simulated exchange for testing.
     Maintains an order book, simulates fills with realistic behavior.
+
+    Internal state (price, balances, order fields) is kept as float so the
+    100 ms simulation tick runs on native FPU arithmetic; Decimal appears
+    only at the adapter API boundary.
+
+    Orders stay as per-id dicts (the adapter API hands them out directly);
+    the hot matching path never scans them — it goes through the price
+    heaps — so a struct-of-arrays order store would only complicate the
+    boundary without touching a hot loop.
     """
 
     def __init__(self, api_key: str = "", api_secret: str = "", initial_price: Decimal = Decimal("50000")):
         super().__init__(api_key, api_secret)
-        self.current_price = initial_price
-        self.balances: Dict[str, Decimal] = {
-            "USD": Decimal("10000"),
-            "BTC": Decimal("0")
+        self.current_price = float(initial_price)
+        self.balances: Dict[str, float] = {
+            "USD": 10000.0,
+            "BTC": 0.0
         }
         self.orders: Dict[str, Dict] = {}
+        # Resting limit orders indexed by price: min-heap of sells, max-heap
+        # of buys (negated price). Cancelled entries are lazily skipped on pop.
+        self._buy_heap: List[Tuple[float, str]] = []
+        self._sell_heap: List[Tuple[float, str]] = []
+        # Open-order ids by symbol, maintained at status transitions so
+        # get_open_orders never scans the full order history
+        self._open_by_symbol: Dict[str, Set[str]] = defaultdict(set)
+        # Both are bounded so a long paper-trading session cannot leak:
+        # trades evict at append, fills evict oldest order FIFO
         self.fills: Dict[str, List[OrderFill]] = {}
-        self.trades: List[Dict] = []
-        self.maker_fee = Decimal("0.001")  # 0.1%
-        self.taker_fee = Decimal("0.003")  # 0.3%
-        self.spread_bps = Decimal("5")  # 5 bps spread
-        self.price_volatility = Decimal("0.02")  # 2% price volatility
+        self._max_fill_orders = 10_000
+        self.trades: deque = deque(maxlen=10_000)
+        self.maker_fee = 0.001  # 0.1%
+        self.taker_fee = 0.003  # 0.3%
+        self.spread_bps = 5.0  # 5 bps spread
+        self._half_spread_factor = self.spread_bps / 20000.0
+        self.price_volatility = 0.02  # 2% price volatility
+        self._tick_sigma = self.price_volatility / 100
+        # Set by the price simulator, awaited by the matcher; bursts of
+        # ticks coalesce into one match pass at the latest price
+        self._tick_event = asyncio.Event()
+        # Tick-cached wall clock: one utcnow() per tick instead of one per
+        # operation; fills within a tick share a timestamp
+        self._now = datetime.utcnow()
+        self._now_mono = time.monotonic()
+        self._fees = (Decimal("0.001"), Decimal("0.003"))
+        # Monotonic order ids: seeded once from urandom, then a plain
+        # counter — no per-order syscall or UUID formatting
+        self._next_id = int.from_bytes(os.urandom(8), "big")
+        self._id_prefix = f"{os.getpid():x}-"
 
     async def connect(self):
         """Connect (instant for fake exchange)."""
         self.connected = True
-        self.last_heartbeat = datetime.utcnow()
-        # Start price simulation
+        self.last_heartbeat = time.monotonic()
+        # Start price simulation and the event-driven matcher
         asyncio.create_task(self._simulate_price_movement())
+        asyncio.create_task(self._match_loop())
 
     async def disconnect(self):
         """Disconnect."""
         self.connected = False
+        self._tick_event.set()  # wake the matcher so it can exit
 
     async def _simulate_price_movement(self):
         """Simulate realistic price movement."""
         while self.connected:
             # Random walk with drift
-            change = random.gauss(0, float(self.price_volatility / 100))
-            self.current_price *= Decimal(str(1 + change))
-            self.last_heartbeat = datetime.utcnow()
-
-            # Check if any limit orders should fill
-            await self._process_limit_orders()
+            self.current_price *= 1 + random.gauss(0.0, self._tick_sigma)
+            self.last_heartbeat = time.monotonic()
+            self._now = datetime.utcnow()
+            self._now_mono = self.last_heartbeat
+            self._tick_event.set()
 
             await asyncio.sleep(0.1)  # Update every 100ms
 
+    async def _match_loop(self):
+        """Match resting orders when a price tick lands, not on a timer."""
+        while self.connected:
+            await self._tick_event.wait()
+            self._tick_event.clear()
+            if not self.connected:
+                break
+            await self._process_limit_orders()
+
     async def _process_limit_orders(self):
-        """Process limit orders that should fill at current price."""
-        for order_id, order in list(self.orders.items()):
-            if order["status"] != OrderStatus.OPEN:
-                continue
-
-            should_fill = False
-            if order["side"] == Side.BUY and self.current_price <= order["price"]:
-                should_fill = True
-            elif order["side"] == Side.SELL and self.current_price >= order["price"]:
-                should_fill = True
-
-            if should_fill:
+        """Fill resting limit orders crossed by the current price."""
+        price = self.current_price
+
+        # Only orders whose limit price crossed are ever popped; everything
+        # else stays untouched, so a tick is O(crossed) not O(all orders)
+        while self._sell_heap and self._sell_heap[0][0] <= price:
+            _, order_id = heapq.heappop(self._sell_heap)
+            order = self.orders[order_id]
+            if order["status"] is OrderStatus.OPEN:
+                await self._fill_order(order_id, order)
+
+        while self._buy_heap and -self._buy_heap[0][0] >= price:
+            _, order_id = heapq.heappop(self._buy_heap)
+            order = self.orders[order_id]
+            if order["status"] is OrderStatus.OPEN:
                 await self._fill_order(order_id, order)
 
     async def _fill_order(self, order_id: str, order: Dict):
@@ -77,124 +133,136 @@ class FakeExchange(ExchangeAdapter):
         qty = order["qty"]
         price = order.get("price", self.current_price)
         side = order["side"]
-        is_maker = order["order_type"] != OrderType.MARKET
+        # Enum members are singletons: identity checks skip the str.__eq__
+        # path of the (str, Enum) classes in this per-fill hot spot
+        is_maker = order["order_type"] is not OrderType.MARKET
 
         # Calculate fee
         fee_rate = self.maker_fee if is_maker else self.taker_fee
 
-        if side == Side.BUY:
-            cost = qty * price
-            fee = cost * fee_rate
-            total_cost = cost + fee
-
-            if self.balances.get("USD", Decimal("0")) >= total_cost:
-                self.balances["USD"] -= total_cost
-                self.balances["BTC"] = self.balances.get("BTC", Decimal("0")) + qty
-
-                # Create fill
-                fill = OrderFill(
-                    order_id=order_id,
-                    timestamp=datetime.utcnow(),
-                    side=side,
-                    qty=qty,
-                    price=price,
-                    fee=fee,
-                    fee_asset="USD"
-                )
-
-                if order_id not in self.fills:
-                    self.fills[order_id] = []
-                self.fills[order_id].append(fill)
-
-                order["status"] = OrderStatus.FILLED
-                order["filled_qty"] = qty
-                order["filled_price"] = price
-            else:
-                order["status"] = OrderStatus.REJECTED
-
-        elif side == Side.SELL:
-            if self.balances.get("BTC", Decimal("0")) >= qty:
-                revenue = qty * price
-                fee = revenue * fee_rate
-                net_revenue = revenue - fee
-
-                self.balances["BTC"] -= qty
-                self.balances["USD"] = self.balances.get("USD", Decimal("0")) + net_revenue
-
-                # Create fill
-                fill = OrderFill(
-                    order_id=order_id,
-                    timestamp=datetime.utcnow(),
-                    side=side,
-                    qty=qty,
-                    price=price,
-                    fee=fee,
-                    fee_asset="USD"
-                )
-
-                if order_id not in self.fills:
-                    self.fills[order_id] = []
-                self.fills[order_id].append(fill)
-
-                order["status"] = OrderStatus.FILLED
-                order["filled_qty"] = qty
-                order["filled_price"] = price
-            else:
-                order["status"] = OrderStatus.REJECTED
+        # Signed-quantity convention: one balance-update path for both sides
+        sign = 1.0 if side is Side.BUY else -1.0
+        notional = qty * price
+        fee = notional * fee_rate
+
+        # Buys need USD to cover notional+fee; sells need the BTC
+        if sign > 0:
+            has_funds = self.balances.get("USD", 0.0) >= notional + fee
+        else:
+            has_funds = self.balances.get("BTC", 0.0) >= qty
+
+        if has_funds:
+            self.balances["USD"] = self.balances.get("USD", 0.0) - sign * notional - fee
+            self.balances["BTC"] = self.balances.get("BTC", 0.0) + sign * qty
+
+            # Create fill
+            fill = OrderFill(
+                order_id=order_id,
+                timestamp=self.now(),
+                side=side,
+                qty=_to_decimal(qty),
+                price=_to_decimal(price),
+                fee=_to_decimal(fee),
+                fee_asset="USD"
+            )
+
+            self._record_fill(order_id, fill)
+
+            order["status"] = OrderStatus.FILLED
+            order["filled_qty"] = qty
+            order["filled_price"] = price
+        else:
+            fill = None
+            order["status"] = OrderStatus.REJECTED
+
+        # Order reached a terminal state either way
+        self._open_by_symbol[order["symbol"]].discard(order_id)
+        self._push_order_update(order_id, order["status"], fill, order.get("idempotency_key"))
+
+    def subscribe_order_updates(self, callback) -> bool:
+        """Push terminal order updates to the caller (no polling needed)."""
+        self._order_update_callbacks.append(callback)
+        return True
+
+    def now(self) -> datetime:
+        """Tick-cached timestamp; refreshed only if the simulator is idle."""
+        if time.monotonic() - self._now_mono > 1.0:
+            self._now = datetime.utcnow()
+            self._now_mono = time.monotonic()
+        return self._now
+
+    def _record_fill(self, order_id: str, fill: OrderFill):
+        """Record a fill, evicting the oldest order's fills past the cap."""
+        fills = self.fills.get(order_id)
+        if fills is None:
+            if len(self.fills) >= self._max_fill_orders:
+                self.fills.pop(next(iter(self.fills)))
+            fills = self.fills[order_id] = []
+        fills.append(fill)
 
     async def get_ticker(self, symbol: str) -> MarketData:
         """Get current market data."""
-        spread = self.current_price * (self.spread_bps / Decimal("10000"))
+        half_spread = self.current_price * self._half_spread_factor
         return MarketData(
             symbol=symbol,
-            timestamp=datetime.utcnow(),
-            bid=self.current_price - spread / 2,
-            ask=self.current_price + spread / 2,
-            last=self.current_price
+            timestamp=self.now(),
+            bid=_to_decimal(self.current_price - half_spread),
+            ask=_to_decimal(self.current_price + half_spread),
+            last=_to_decimal(self.current_price)
         )
 
     async def get_balance(self, asset: str) -> Decimal:
         """Get balance for asset."""
-        return self.balances.get(asset, Decimal("0"))
+        return _to_decimal(self.balances.get(asset, 0.0))
 
     async def get_balances(self) -> Dict[str, Decimal]:
         """Get all balances."""
-        return self.balances.copy()
+        return {asset: _to_decimal(value) for asset, value in self.balances.items()}
 
     async def place_order(self, symbol: str, order: OrderRequest) -> str:
         """Place an order."""
-        order_id = str(uuid.uuid4())
+        self._next_id += 1
+        order_id = self._id_prefix + f"{self._next_id:016x}"
 
         order_dict = {
             "id": order_id,
             "symbol": symbol,
             "side": order.side,
             "order_type": order.order_type,
-            "qty": order.qty,
-            "price": order.price,
+            "qty": float(order.qty),
+            "price": float(order.price) if order.price is not None else None,
             "status": OrderStatus.PENDING,
-            "filled_qty": Decimal("0"),
+            "idempotency_key": order.idempotency_key,
+            "filled_qty": 0.0,
             "filled_price": None,
-            "created_at": datetime.utcnow()
+            "created_at": self.now()
         }
 
         self.orders[order_id] = order_dict
 
         # Process market orders immediately
-        if order.order_type == OrderType.MARKET:
+        if order.order_type is OrderType.MARKET:
             order_dict["status"] = OrderStatus.OPEN
             await self._fill_order(order_id, order_dict)
         else:
             order_dict["status"] = OrderStatus.OPEN
+            self._open_by_symbol[symbol].add(order_id)
+            if order_dict["price"] is not None:
+                if order.side is Side.BUY:
+                    heapq.heappush(self._buy_heap, (-order_dict["price"], order_id))
+                else:
+                    heapq.heappush(self._sell_heap, (order_dict["price"], order_id))
 
         return order_id
 
     async def cancel_order(self, symbol: str, order_id: str) -> bool:
         """Cancel an order."""
-        if order_id in self.orders:
-            if self.orders[order_id]["status"] == OrderStatus.OPEN:
-                self.orders[order_id]["status"] = OrderStatus.CANCELLED
-                return True
+        order = self.orders.get(order_id)
+        if order is not None and order["status"] is OrderStatus.OPEN:
+            order["status"] = OrderStatus.CANCELLED
+            self._open_by_symbol[order["symbol"]].discard(order_id)
+            self._push_order_update(order_id, OrderStatus.CANCELLED, None, order.get("idempotency_key"))
+            return True
         return False
 
     async def get_order_status(self, symbol: str, order_id: str) -> OrderStatus:
@@ -209,15 +277,11 @@ class FakeExchange(ExchangeAdapter):
 
     async def get_open_orders(self, symbol: str) -> List[Dict]:
         """Get open orders."""
-        return [
-            order for order in self.orders.values()
-            if order["status"] in [OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED]
-            and order["symbol"] == symbol
-        ]
+        return [self.orders[order_id] for order_id in self._open_by_symbol.get(symbol, ())]
 
     async def get_recent_trades(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get recent trades."""
-        return self.trades[-limit:]
+        return list(islice(self.trades, max(0, len(self.trades) - limit), None))
 
     async def get_ohlcv(
         self,
@@ -227,36 +291,36 @@ class FakeExchange(ExchangeAdapter):
         limit: int = 100
     ) -> List[Dict]:
         """Get OHLCV data (simulated)."""
-        # For testing, generate some random candles
-        candles = []
-        current_time = since or datetime.utcnow() - timedelta(hours=limit)
-        current_price = self.current_price
-
-        for i in range(limit):
-            # Random candle
-            open_price = current_price
-            change = random.gauss(0, 0.01)  # 1% volatility
-            close_price = open_price * Decimal(str(1 + change))
-            high_price = max(open_price, close_price) * Decimal("1.002")
-            low_price = min(open_price, close_price) * Decimal("0.998")
-
-            candles.append({
-                "timestamp": current_time,
-                "open": float(open_price),
-                "high": float(high_price),
-                "low": float(low_price),
-                "close": float(close_price),
-                "volume": random.uniform(1, 10)
-            })
-
-            current_time += timedelta(minutes=1)
-            current_price = close_price
-
-        return candles
+        # For testing, generate random candles in one vectorized pass:
+        # a cumulative-product random walk instead of a per-candle loop
+        start_time = since or self.now() - timedelta(hours=limit)
+
+        changes = np.random.normal(0, 0.01, limit)  # 1% volatility
+        closes = self.current_price * np.cumprod(1 + changes)
+        opens = np.concatenate(([self.current_price], closes[:-1]))
+        highs = np.maximum(opens, closes) * 1.002
+        lows = np.minimum(opens, closes) * 0.998
+        volumes = np.random.uniform(1, 10, limit)
+        timestamps = [start_time + timedelta(minutes=i) for i in range(limit)]
+
+        return [
+            {
+                "timestamp": ts,
+                "open": o,
+                "high": h,
+                "low": l,
+                "close": c,
+                "volume": v
+            }
+            for ts, o, h, l, c, v in zip(
+                timestamps, opens.tolist(), highs.tolist(),
+                lows.tolist(), closes.tolist(), volumes.tolist()
+            )
+        ]
 
     def get_fees(self) -> Tuple[Decimal, Decimal]:
         """Get fees."""
-        return (self.maker_fee, self.taker_fee)
+        return self._fees
 
     def get_min_notional(self, symbol: str) -> Decimal:
         """Get minimum notional."""
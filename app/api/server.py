@@ -2,16 +2,15 @@
 FastAPI server for controlling the trading system.
 """
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from pydantic import BaseModel
 from typing import Optional
 from decimal import Decimal
 from datetime import datetime
-import pandas as pd
-from app.services.paper_trader import PaperTrader
-from app.services.live_trader import LiveTrader
-from app.services.backtester import Backtester, BacktestConfig
+from typing import TYPE_CHECKING
 from app.core.config import settings
+from app.core import metrics_buf
+from app.adapters._http import close_shared_session
 from app.db.database import init_db, get_db
 from sqlalchemy.orm import Session
 import logging
@@ -22,12 +21,32 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Volatility Harvester API",
     description="Control API for BTC Volatility Harvesting Trading Engine",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Global trader instances
-paper_trader: Optional[PaperTrader] = None
-live_trader: Optional[LiveTrader] = None
+if TYPE_CHECKING:
+    from app.services.paper_trader import PaperTrader
+    from app.services.live_trader import LiveTrader
+
+# Global trader instances (trader modules pull in pandas; import lazily so
+# workers that only serve /healthz, /status and /metrics stay light)
+paper_trader: Optional["PaperTrader"] = None
+live_trader: Optional["LiveTrader"] = None
+
+# Settings are immutable at runtime, so the /config body never changes
+_CONFIG_CACHE = {
+    "exchange": settings.exchange,
+    "symbol": settings.symbol,
+    "mode": settings.mode,
+    "buy_threshold_pct": float(settings.buy_threshold_pct),
+    "sell_threshold_pct": float(settings.sell_threshold_pct),
+    "adaptive_thresholds": settings.adaptive_thresholds,
+    "max_drawdown_pct": float(settings.max_drawdown_pct),
+    "max_consecutive_losses": settings.max_consecutive_losses,
+    "maker_first": settings.maker_first,
+    "reserve_pct": float(settings.reserve_pct)
+}
 
 
 # Request models
@@ -66,6 +85,8 @@ async def shutdown():
     if live_trader and live_trader.running:
         await live_trader.stop()
 
+    await close_shared_session()
+
 
 # Health check
 @app.get("/healthz")
@@ -73,7 +94,7 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),  # orjson serializes datetime natively
         "mode": settings.mode
     }
 
@@ -109,6 +130,8 @@ async def start_trading(request: StartTradingRequest):
         if paper_trader and paper_trader.running:
             raise HTTPException(status_code=400, detail="Paper trader already running")
 
+        from app.services.paper_trader import PaperTrader
+
         paper_trader = PaperTrader(Decimal(str(request.initial_capital)))
         await paper_trader.start()
 
@@ -125,6 +148,8 @@ async def start_trading(request: StartTradingRequest):
         # Extra confirmation for live trading
         logger.warning("Starting LIVE trading with REAL MONEY")
 
+        from app.services.live_trader import LiveTrader
+
         live_trader = LiveTrader()
         await live_trader.start()
 
@@ -176,29 +201,30 @@ async def run_backtest(request: BacktestRequest, db: Session = Depends(get_db)):
     """Run backtest."""
     try:
         from app.data.candles_repo import CandlesRepository
+        from app.services.backtester import Backtester, BacktestConfig
 
         # Load candles from database
         candles_repo = CandlesRepository(db)
         start_date = datetime.fromisoformat(request.start_date)
         end_date = datetime.fromisoformat(request.end_date) if request.end_date else None
 
-        candles = candles_repo.get_candles(
+        # Core path: loads straight into float64 columns without hydrating
+        # one ORM Candle per row first
+        candles_df = candles_repo.get_candles_df(
             symbol=settings.symbol,
             timeframe="1m",
             start=start_date,
             end=end_date
         )
 
-        if not candles:
+        if candles_df.empty:
             raise HTTPException(status_code=404, detail="No candles found for date range")
 
-        candles_df = candles_repo.candles_to_dataframe(candles)
-
-        # Create backtest config
-        config = BacktestConfig(
-            initial_capital=Decimal(str(request.initial_capital)),
-            buy_threshold_pct=Decimal(str(request.buy_threshold_pct)),
-            sell_threshold_pct=Decimal(str(request.sell_threshold_pct)),
+        # Create backtest config (from_floats owns the Decimal boundary)
+        config = BacktestConfig.from_floats(
+            initial_capital=request.initial_capital,
+            buy_threshold_pct=request.buy_threshold_pct,
+            sell_threshold_pct=request.sell_threshold_pct,
             adaptive_thresholds=request.adaptive_thresholds
         )
 
@@ -206,7 +232,17 @@ async def run_backtest(request: BacktestRequest, db: Session = Depends(get_db)):
         backtester = Backtester(config)
         result = backtester.run(candles_df, settings.symbol)
 
-        # Return results
+        # Return results; pre-convert any Decimal values once so orjson
+        # serializes plain floats instead of falling back per-field
+        config_out = {
+            k: (float(v) if isinstance(v, Decimal) else v)
+            for k, v in result.config.items()
+        }
+        trades_out = [
+            {k: (float(v) if isinstance(v, Decimal) else v) for k, v in t.items()}
+            for t in result.trades[:100]  # Limit to first 100 trades in response
+        ]
+
         return {
             "initial_capital": result.initial_capital,
             "final_capital": result.final_capital,
@@ -219,8 +255,8 @@ async def run_backtest(request: BacktestRequest, db: Session = Depends(get_db)):
             "sortino_ratio": result.sortino_ratio,
             "cagr": result.cagr,
             "total_fees_paid": result.total_fees_paid,
-            "config": result.config,
-            "trades": result.trades[:100]  # Limit to first 100 trades in response
+            "config": config_out,
+            "trades": trades_out
         }
 
     except Exception as e:
@@ -232,18 +268,7 @@ async def run_backtest(request: BacktestRequest, db: Session = Depends(get_db)):
 @app.get("/config")
 async def get_config():
     """Get current configuration."""
-    return {
-        "exchange": settings.exchange,
-        "symbol": settings.symbol,
-        "mode": settings.mode,
-        "buy_threshold_pct": float(settings.buy_threshold_pct),
-        "sell_threshold_pct": float(settings.sell_threshold_pct),
-        "adaptive_thresholds": settings.adaptive_thresholds,
-        "max_drawdown_pct": float(settings.max_drawdown_pct),
-        "max_consecutive_losses": settings.max_consecutive_losses,
-        "maker_first": settings.maker_first,
-        "reserve_pct": float(settings.reserve_pct)
-    }
+    return _CONFIG_CACHE
 
 
 # Get metrics (Prometheus format)
@@ -255,40 +280,17 @@ async def get_metrics():
     trader = paper_trader if settings.mode == "paper" else live_trader
 
     if not trader or not trader.running:
-        return "# No trader running\n"
-
-    status = trader.get_status()
-
-    metrics = []
-    metrics.append(f"# HELP volharvester_equity_usd Current total equity in USD")
-    metrics.append(f"# TYPE volharvester_equity_usd gauge")
-    metrics.append(f"volharvester_equity_usd {status['equity']}")
-
-    metrics.append(f"# HELP volharvester_realized_pnl_usd Realized PnL in USD")
-    metrics.append(f"# TYPE volharvester_realized_pnl_usd gauge")
-    metrics.append(f"volharvester_realized_pnl_usd {status['realized_pnl']}")
-
-    metrics.append(f"# HELP volharvester_unrealized_pnl_usd Unrealized PnL in USD")
-    metrics.append(f"# TYPE volharvester_unrealized_pnl_usd gauge")
-    metrics.append(f"volharvester_unrealized_pnl_usd {status['unrealized_pnl']}")
-
-    metrics.append(f"# HELP volharvester_total_trades Total number of trades")
-    metrics.append(f"# TYPE volharvester_total_trades counter")
-    metrics.append(f"volharvester_total_trades {status['total_trades']}")
-
-    metrics.append(f"# HELP volharvester_win_rate Win rate percentage")
-    metrics.append(f"# TYPE volharvester_win_rate gauge")
-    metrics.append(f"volharvester_win_rate {status['win_rate']}")
-
-    metrics.append(f"# HELP volharvester_drawdown_pct Current drawdown percentage")
-    metrics.append(f"# TYPE volharvester_drawdown_pct gauge")
-    metrics.append(f"volharvester_drawdown_pct {status['drawdown_pct']}")
+        return PlainTextResponse("# No trader running\n", media_type=metrics_buf.CONTENT_TYPE)
 
-    metrics.append(f"# HELP volharvester_paused Whether trading is paused")
-    metrics.append(f"# TYPE volharvester_paused gauge")
-    metrics.append(f"volharvester_paused {1 if status['paused'] else 0}")
+    # The trader publishes its status into the shared buffer at tick
+    # cadence; a scrape is just a copy of the latest body
+    body = metrics_buf.render()
+    if not body:
+        # Trader started but has not ticked yet; seed the buffer once
+        metrics_buf.publish(trader.get_status())
+        body = metrics_buf.render()
 
-    return "\n".join(metrics)
+    return PlainTextResponse(body, media_type=metrics_buf.CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 from typing import Literal, Optional
 from decimal import Decimal
+from dataclasses import dataclass
 
 
 class Settings(BaseSettings):
@@ -103,5 +104,77 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@dataclass(frozen=True, slots=True)
+class FastSettings:
+    """
+    Read-only snapshot of the hot-path settings.
+
+    Pydantic validates once at load; trader/risk/strategy loops read this
+    frozen slots dataclass instead, which is a plain C attribute lookup and
+    carries thresholds pre-converted from Decimal to float.
+    """
+    exchange: str
+    symbol: str
+    mode: str
+    buy_threshold_pct: float
+    sell_threshold_pct: float
+    min_swing_pct: float
+    max_swing_pct: float
+    adaptive_thresholds: bool
+    reserve_pct: float
+    max_drawdown_pct: float
+    max_consecutive_losses: int
+    daily_loss_limit_pct: float
+    min_activity_pct: float
+    max_activity_pct: float
+    max_spread_bps: int
+    max_ws_stale_seconds: int
+    maker_first: bool
+    taker_slippage_bps: int
+    min_notional_usd: float
+    order_timeout_seconds: int
+    maker_fee_pct: float
+    taker_fee_pct: float
+    atr_period: int
+    use_trend_filter: bool
+    ma_short: int
+    ma_long: int
+
+
+def _freeze(s: "Settings") -> FastSettings:
+    """Snapshot validated settings into the frozen hot-path view."""
+    return FastSettings(
+        exchange=s.exchange,
+        symbol=s.symbol,
+        mode=s.mode,
+        buy_threshold_pct=float(s.buy_threshold_pct),
+        sell_threshold_pct=float(s.sell_threshold_pct),
+        min_swing_pct=float(s.min_swing_pct),
+        max_swing_pct=float(s.max_swing_pct),
+        adaptive_thresholds=s.adaptive_thresholds,
+        reserve_pct=float(s.reserve_pct),
+        max_drawdown_pct=float(s.max_drawdown_pct),
+        max_consecutive_losses=s.max_consecutive_losses,
+        daily_loss_limit_pct=float(s.daily_loss_limit_pct),
+        min_activity_pct=float(s.min_activity_pct),
+        max_activity_pct=float(s.max_activity_pct),
+        max_spread_bps=s.max_spread_bps,
+        max_ws_stale_seconds=s.max_ws_stale_seconds,
+        maker_first=s.maker_first,
+        taker_slippage_bps=s.taker_slippage_bps,
+        min_notional_usd=float(s.min_notional_usd),
+        order_timeout_seconds=s.order_timeout_seconds,
+        maker_fee_pct=float(s.maker_fee_pct),
+        taker_fee_pct=float(s.taker_fee_pct),
+        atr_period=s.atr_period,
+        use_trend_filter=s.use_trend_filter,
+        ma_short=s.ma_short,
+        ma_long=s.ma_long
+    )
+
+
 # Global settings instance
 settings = Settings()
+
+# Frozen hot-path snapshot (use this in per-tick code)
+settings_fast = _freeze(settings)
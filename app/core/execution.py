@@ -1,11 +1,11 @@
 """
 Execution engine - handles order placement, fills, and order lifecycle.
 """
-from decimal import Decimal
+from decimal import Decimal, ROUND_DOWN
 from typing import Optional, Tuple
-from datetime import datetime
 import asyncio
-import uuid
+import os
+import time
 from app.adapters.exchange_base import ExchangeAdapter
 from app.core.models import OrderRequest, OrderFill, MarketData, Signal
 from app.core.enums import Side, OrderType, OrderStatus
@@ -15,6 +15,25 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Replayed-signal dedup window: how long an executed signal suppresses
+# an identical re-delivery, and how many entries to keep
+_SIGNAL_TTL_SECONDS = 60.0
+_SIGNAL_CACHE_MAX = 1024
+
+# Hot-path Decimal constants, parsed once instead of per order
+_QUARTER = Decimal("0.25")
+_ONE = Decimal("1")
+_TEN_THOUSAND = Decimal("10000")
+# Slippage multipliers are fixed for the session
+_SLIP_UP = _ONE + settings.taker_slippage_bps / _TEN_THOUSAND
+_SLIP_DOWN = _ONE - settings.taker_slippage_bps / _TEN_THOUSAND
+
+
+def _make_key(prefix: str) -> str:
+    """Random idempotency key: 8 urandom bytes, skipping UUID overhead."""
+    return f"{prefix}_{os.urandom(8).hex()}"
+
+
 class ExecutionEngine:
     """
     Handles order execution with maker-first logic and fallback to taker.
@@ -30,11 +49,68 @@ class ExecutionEngine:
         self.symbol = symbol
         self.maker_fee_pct = settings.maker_fee_pct / Decimal("100")
         self.taker_fee_pct = settings.taker_fee_pct / Decimal("100")
+        # Indexed by bool(is_maker) for branchless selection
+        self._fee_fractions = (self.taker_fee_pct, self.maker_fee_pct)
+        # Fill waiters keyed by idempotency key / order id; created only
+        # by the waiting side, resolved (never created) by pushed updates
+        self._pending_fills: dict = {}
+        self._push_fills = exchange.subscribe_order_updates(self._on_order_update)
+        # Symbol metadata is constant for a session; pull it once instead
+        # of dispatching into the adapter on every order
+        self.refresh_symbol_info()
+        # Per-side reusable order templates. The engine has at most one
+        # order in flight and adapters consume the request during the
+        # place_order call, so mutating fields in place is safe and skips
+        # a dataclass allocation per attempt.
+        self._buy_tpl = OrderRequest(side=Side.BUY, order_type=OrderType.POST_ONLY, qty=Decimal(0))
+        self._sell_tpl = OrderRequest(side=Side.SELL, order_type=OrderType.POST_ONLY, qty=Decimal(0))
+        # Recently executed signals: key -> (monotonic expiry, result).
+        # Oldest entry is evicted FIFO past the cap.
+        self._recent_signals: dict = {}
+
+    def refresh_symbol_info(self):
+        """Re-read per-symbol metadata (call after exchange reconnect)."""
+        self._min_notional = self.exchange.get_min_notional(self.symbol)
+        self._lot_size = self.exchange.get_lot_size(self.symbol)
+
+    def _on_order_update(
+        self,
+        order_id: str,
+        status: OrderStatus,
+        fill: Optional[OrderFill],
+        client_key: Optional[str] = None
+    ):
+        """Resolve the waiter for a pushed terminal order update."""
+        # Waiters registered before place_order returned are keyed by the
+        # idempotency key; fall back to the exchange order id otherwise
+        if client_key is not None and client_key in self._pending_fills:
+            key = client_key
+        else:
+            key = order_id
+        # Only resolve an existing waiter — creating one here would leak
+        # an orphaned future whenever a push lands after the waiter gave
+        # up (e.g. post-timeout) and nothing ever consumes it
+        future = self._pending_fills.get(key)
+        if future is not None and not future.done():
+            future.set_result(fill if status == OrderStatus.FILLED else None)
+
+    def _register_fill_future(self, key: str) -> Optional[asyncio.Future]:
+        """
+        Register a fill waiter before the order is placed.
+
+        Keying on the idempotency key closes the window where a fill is
+        pushed while place_order's response (with the exchange order id)
+        is still in flight. Returns None when the adapter cannot push.
+        """
+        if not self._push_fills:
+            return None
+        future = asyncio.get_event_loop().create_future()
+        self._pending_fills[key] = future
+        return future
 
     def calculate_fee(self, notional: Decimal, is_maker: bool) -> Decimal:
         """Calculate trading fee."""
-        fee_pct = self.maker_fee_pct if is_maker else self.taker_fee_pct
-        return notional * fee_pct
+        return notional * self._fee_fractions[is_maker]
 
     async def execute_buy(
         self,
@@ -54,70 +130,87 @@ class ExecutionEngine:
             (success, fill, error_message)
         """
         # Validate and round quantity
-        qty = self.exchange.round_quantity(self.symbol, qty)
-        min_notional = self.exchange.get_min_notional(self.symbol)
+        qty = qty.quantize(self._lot_size, rounding=ROUND_DOWN)
 
         notional = qty * market_data.ask
-        if notional < min_notional:
-            return (False, None, f"Order size ${notional:.2f} below minimum ${min_notional:.2f}")
+        if notional < self._min_notional:
+            return (False, None, f"Order size ${notional:.2f} below minimum ${self._min_notional:.2f}")
 
         if maker_first and settings.maker_first:
             # Try limit order at bid (inside spread)
-            limit_price = market_data.bid + (market_data.ask - market_data.bid) * Decimal("0.25")  # 25% into spread
+            limit_price = market_data.bid + (market_data.ask - market_data.bid) * _QUARTER  # 25% into spread
             limit_price = self.exchange.round_price(self.symbol, limit_price)
 
-            logger.info(f"Attempting maker buy: {qty:.8f} @ ${limit_price:.2f}")
+            logger.info("Attempting maker buy: %.8f @ $%.2f", qty, limit_price)
 
-            order = OrderRequest(
-                side=Side.BUY,
-                order_type=OrderType.POST_ONLY,
-                qty=qty,
-                price=limit_price,
-                post_only=True,
-                timeout_seconds=settings.order_timeout_seconds,
-                idempotency_key=f"buy_{uuid.uuid4().hex[:16]}"
-            )
+            order = self._buy_tpl
+            order.order_type = OrderType.POST_ONLY
+            order.qty = qty
+            order.price = limit_price
+            order.post_only = True
+            order.timeout_seconds = settings.order_timeout_seconds
+            order.idempotency_key = _make_key("buy")
 
             try:
+                fill_future = self._register_fill_future(order.idempotency_key)
                 order_id = await self.exchange.place_order(self.symbol, order)
 
                 # Wait for fill
-                fill = await self._wait_for_fill(order_id, order.timeout_seconds)
+                fill = await self._wait_for_fill(
+                    order_id, order.timeout_seconds,
+                    future=fill_future, key=order.idempotency_key,
+                    keep_on_timeout=True
+                )
 
                 if fill is not None:
-                    logger.info(f"Maker buy filled: {fill.qty:.8f} @ ${fill.price:.2f}")
+                    logger.info("Maker buy filled: %.8f @ $%.2f", fill.qty, fill.price)
                     return (True, fill, None)
 
-                # Not filled, cancel
+                # Not filled, cancel. Shield so an outer cancellation
+                # cannot orphan the resting order mid-cancel.
                 logger.warning("Maker order not filled, cancelling...")
-                await self.exchange.cancel_order(self.symbol, order_id)
+                await asyncio.shield(self.exchange.cancel_order(self.symbol, order_id))
+
+                # The order may have filled while the cancel was in
+                # flight; consume that fill instead of double-executing
+                if fill_future is not None and fill_future.done() and fill_future.result() is not None:
+                    fill = fill_future.result()
+                    logger.info("Maker buy filled during cancel: %.8f @ $%.2f", fill.qty, fill.price)
+                    return (True, fill, None)
 
             except Exception as e:
-                logger.error(f"Maker order failed: {e}")
+                logger.error("Maker order failed: %s", e)
                 # Fall through to taker
+            finally:
+                # The waiter owns its entry: drop it on every exit so a
+                # raise or cancellation mid-sequence cannot leak it
+                self._pending_fills.pop(order.idempotency_key, None)
 
         # Fallback to taker (market order)
-        logger.info(f"Executing taker buy: {qty:.8f} @ market")
+        logger.info("Executing taker buy: %.8f @ market", qty)
 
         # Estimate price with slippage
-        estimated_price = market_data.ask * (Decimal("1") + settings.taker_slippage_bps / Decimal("10000"))
+        estimated_price = market_data.ask * _SLIP_UP
 
-        order = OrderRequest(
-            side=Side.BUY,
-            order_type=OrderType.MARKET,
-            qty=qty,
-            price=estimated_price,  # For notional calculation
-            idempotency_key=f"buy_mkt_{uuid.uuid4().hex[:16]}"
-        )
+        order = self._buy_tpl
+        order.order_type = OrderType.MARKET
+        order.qty = qty
+        order.price = estimated_price  # For notional calculation
+        order.post_only = False
+        order.idempotency_key = _make_key("buy_mkt")
 
         try:
+            fill_future = self._register_fill_future(order.idempotency_key)
             order_id = await self.exchange.place_order(self.symbol, order)
 
             # Wait for fill
-            fill = await self._wait_for_fill(order_id, timeout=10)
+            fill = await self._wait_for_fill(
+                order_id, timeout=10,
+                future=fill_future, key=order.idempotency_key
+            )
 
             if fill is not None:
-                logger.info(f"Taker buy filled: {fill.qty:.8f} @ ${fill.price:.2f}")
+                logger.info("Taker buy filled: %.8f @ $%.2f", fill.qty, fill.price)
                 return (True, fill, None)
             else:
                 return (False, None, "Market order failed to fill")
@@ -126,6 +219,8 @@ class ExecutionEngine:
             error_msg = f"Buy execution failed: {e}"
             logger.error(error_msg)
             return (False, None, error_msg)
+        finally:
+            self._pending_fills.pop(order.idempotency_key, None)
 
     async def execute_sell(
         self,
@@ -145,70 +240,87 @@ class ExecutionEngine:
             (success, fill, error_message)
         """
         # Validate and round quantity
-        qty = self.exchange.round_quantity(self.symbol, qty)
-        min_notional = self.exchange.get_min_notional(self.symbol)
+        qty = qty.quantize(self._lot_size, rounding=ROUND_DOWN)
 
         notional = qty * market_data.bid
-        if notional < min_notional:
-            return (False, None, f"Order size ${notional:.2f} below minimum ${min_notional:.2f}")
+        if notional < self._min_notional:
+            return (False, None, f"Order size ${notional:.2f} below minimum ${self._min_notional:.2f}")
 
         if maker_first and settings.maker_first:
             # Try limit order at ask (inside spread)
-            limit_price = market_data.ask - (market_data.ask - market_data.bid) * Decimal("0.25")  # 25% into spread
+            limit_price = market_data.ask - (market_data.ask - market_data.bid) * _QUARTER  # 25% into spread
             limit_price = self.exchange.round_price(self.symbol, limit_price)
 
-            logger.info(f"Attempting maker sell: {qty:.8f} @ ${limit_price:.2f}")
+            logger.info("Attempting maker sell: %.8f @ $%.2f", qty, limit_price)
 
-            order = OrderRequest(
-                side=Side.SELL,
-                order_type=OrderType.POST_ONLY,
-                qty=qty,
-                price=limit_price,
-                post_only=True,
-                timeout_seconds=settings.order_timeout_seconds,
-                idempotency_key=f"sell_{uuid.uuid4().hex[:16]}"
-            )
+            order = self._sell_tpl
+            order.order_type = OrderType.POST_ONLY
+            order.qty = qty
+            order.price = limit_price
+            order.post_only = True
+            order.timeout_seconds = settings.order_timeout_seconds
+            order.idempotency_key = _make_key("sell")
 
             try:
+                fill_future = self._register_fill_future(order.idempotency_key)
                 order_id = await self.exchange.place_order(self.symbol, order)
 
                 # Wait for fill
-                fill = await self._wait_for_fill(order_id, order.timeout_seconds)
+                fill = await self._wait_for_fill(
+                    order_id, order.timeout_seconds,
+                    future=fill_future, key=order.idempotency_key,
+                    keep_on_timeout=True
+                )
 
                 if fill is not None:
-                    logger.info(f"Maker sell filled: {fill.qty:.8f} @ ${fill.price:.2f}")
+                    logger.info("Maker sell filled: %.8f @ $%.2f", fill.qty, fill.price)
                     return (True, fill, None)
 
-                # Not filled, cancel
+                # Not filled, cancel. Shield so an outer cancellation
+                # cannot orphan the resting order mid-cancel.
                 logger.warning("Maker order not filled, cancelling...")
-                await self.exchange.cancel_order(self.symbol, order_id)
+                await asyncio.shield(self.exchange.cancel_order(self.symbol, order_id))
+
+                # The order may have filled while the cancel was in
+                # flight; consume that fill instead of double-executing
+                if fill_future is not None and fill_future.done() and fill_future.result() is not None:
+                    fill = fill_future.result()
+                    logger.info("Maker sell filled during cancel: %.8f @ $%.2f", fill.qty, fill.price)
+                    return (True, fill, None)
 
             except Exception as e:
-                logger.error(f"Maker order failed: {e}")
+                logger.error("Maker order failed: %s", e)
                 # Fall through to taker
+            finally:
+                # The waiter owns its entry: drop it on every exit so a
+                # raise or cancellation mid-sequence cannot leak it
+                self._pending_fills.pop(order.idempotency_key, None)
 
         # Fallback to taker (market order)
-        logger.info(f"Executing taker sell: {qty:.8f} @ market")
+        logger.info("Executing taker sell: %.8f @ market", qty)
 
         # Estimate price with slippage
-        estimated_price = market_data.bid * (Decimal("1") - settings.taker_slippage_bps / Decimal("10000"))
+        estimated_price = market_data.bid * _SLIP_DOWN
 
-        order = OrderRequest(
-            side=Side.SELL,
-            order_type=OrderType.MARKET,
-            qty=qty,
-            price=estimated_price,  # For notional calculation
-            idempotency_key=f"sell_mkt_{uuid.uuid4().hex[:16]}"
-        )
+        order = self._sell_tpl
+        order.order_type = OrderType.MARKET
+        order.qty = qty
+        order.price = estimated_price  # For notional calculation
+        order.post_only = False
+        order.idempotency_key = _make_key("sell_mkt")
 
         try:
+            fill_future = self._register_fill_future(order.idempotency_key)
             order_id = await self.exchange.place_order(self.symbol, order)
 
             # Wait for fill
-            fill = await self._wait_for_fill(order_id, timeout=10)
+            fill = await self._wait_for_fill(
+                order_id, timeout=10,
+                future=fill_future, key=order.idempotency_key
+            )
 
             if fill is not None:
-                logger.info(f"Taker sell filled: {fill.qty:.8f} @ ${fill.price:.2f}")
+                logger.info("Taker sell filled: %.8f @ $%.2f", fill.qty, fill.price)
                 return (True, fill, None)
             else:
                 return (False, None, "Market order failed to fill")
@@ -217,22 +329,60 @@ class ExecutionEngine:
             error_msg = f"Sell execution failed: {e}"
             logger.error(error_msg)
             return (False, None, error_msg)
+        finally:
+            self._pending_fills.pop(order.idempotency_key, None)
 
-    async def _wait_for_fill(self, order_id: str, timeout: int = 30) -> Optional[OrderFill]:
+    async def _wait_for_fill(
+        self,
+        order_id: str,
+        timeout: int = 30,
+        future: Optional[asyncio.Future] = None,
+        key: Optional[str] = None,
+        keep_on_timeout: bool = False
+    ) -> Optional[OrderFill]:
         """
         Wait for order to fill.
 
         Args:
             order_id: Order ID to wait for
             timeout: Timeout in seconds
+            future: Waiter pre-registered via _register_fill_future
+            key: Idempotency key the future was registered under
+            keep_on_timeout: Leave the waiter registered after a timeout
+                so the caller can still consume a fill that races the
+                cancel it is about to send
 
         Returns:
             OrderFill if filled, None otherwise
         """
-        start_time = datetime.utcnow()
+        if self._push_fills:
+            # Event-driven path: the adapter pushes terminal updates, so
+            # wait on a future instead of polling REST twice per cycle.
+            # setdefault handles fills that landed before we got here.
+            if future is None:
+                key = order_id
+                future = self._pending_fills.setdefault(
+                    order_id, asyncio.get_event_loop().create_future()
+                )
+            try:
+                # Shield so a timeout doesn't cancel the future itself —
+                # it must stay resolvable by a late pushed update
+                result = await asyncio.wait_for(asyncio.shield(future), timeout)
+                self._pending_fills.pop(key, None)
+                return result
+            except asyncio.TimeoutError:
+                if not keep_on_timeout:
+                    self._pending_fills.pop(key, None)
+                logger.warning("Order %s timed out after %ss", order_id, timeout)
+                return None
+
+        # Polling fallback for adapters without an order-update stream.
+        # Monotonic deadline: no datetime/timedelta allocation per poll
+        # and immune to wall-clock adjustments.
+        deadline_ns = time.monotonic_ns() + timeout * 1_000_000_000
         check_interval = 0.5  # Check every 500ms
 
-        while (datetime.utcnow() - start_time).total_seconds() < timeout:
+        while time.monotonic_ns() < deadline_ns:
             status = await self.exchange.get_order_status(self.symbol, order_id)
 
             if status == OrderStatus.FILLED:
@@ -245,12 +395,12 @@ class ExecutionEngine:
                     return None
 
             elif status in [OrderStatus.CANCELLED, OrderStatus.REJECTED, OrderStatus.EXPIRED]:
-                logger.warning(f"Order {order_id} ended with status {status}")
+                logger.warning("Order %s ended with status %s", order_id, status)
                 return None
 
             await asyncio.sleep(check_interval)
 
-        logger.warning(f"Order {order_id} timed out after {timeout}s")
+        logger.warning("Order %s timed out after %ss", order_id, timeout)
         return None
 
     async def execute_signal(
@@ -270,9 +420,27 @@ class ExecutionEngine:
         Returns:
             (success, fill, error_message)
         """
+        # Short-circuit replayed signals (e.g. reconnect re-deliveries):
+        # an identical signal executed within the TTL returns the original
+        # result instead of round-tripping to the exchange again
+        key = (signal.timestamp, signal.signal_type, qty)
+        cached = self._recent_signals.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            logger.warning("Duplicate signal suppressed: %s @ %s", signal.signal_type, signal.timestamp)
+            return cached[1]
+
         if signal.signal_type == "buy":
-            return await self.execute_buy(qty, market_data)
+            result = await self.execute_buy(qty, market_data)
         elif signal.signal_type == "sell":
-            return await self.execute_sell(qty, market_data)
+            result = await self.execute_sell(qty, market_data)
         else:
             return (False, None, f"Invalid signal type: {signal.signal_type}")
+
+        # Only successful executions are memoized — failures stay
+        # retryable on the next delivery
+        if result[0]:
+            if len(self._recent_signals) >= _SIGNAL_CACHE_MAX:
+                self._recent_signals.pop(next(iter(self._recent_signals)))
+            self._recent_signals[key] = (time.monotonic() + _SIGNAL_TTL_SECONDS, result)
+
+        return result
@@ -3,7 +3,20 @@ Fee calculation utilities.
 """
 from decimal import Decimal
 from typing import Tuple
-from app.core.config import settings
+import numpy as np
+from app.core.config import settings, settings_fast
+
+# Settings are immutable at runtime; normalize the fee percentages to
+# fractions once so per-call fee math is a single Decimal multiply
+# (Decimal division is the slowest op in libmpdec)
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+_MAKER_FRACTION = settings.maker_fee_pct / _HUNDRED
+_TAKER_FRACTION = settings.taker_fee_pct / _HUNDRED
+_MAKER_FRACTION_F = settings_fast.maker_fee_pct / 100.0
+_TAKER_FRACTION_F = settings_fast.taker_fee_pct / 100.0
+# Indexed by bool(is_maker): one subscript instead of a conditional jump
+_FRACTIONS = (_TAKER_FRACTION, _MAKER_FRACTION)
 
 
 def calculate_trading_fee(notional: Decimal, is_maker: bool = True) -> Decimal:
@@ -17,8 +30,31 @@ def calculate_trading_fee(notional: Decimal, is_maker: bool = True) -> Decimal:
     Returns:
         Fee amount in USD
     """
-    fee_pct = settings.maker_fee_pct if is_maker else settings.taker_fee_pct
-    return notional * (fee_pct / Decimal("100"))
+    return notional * _FRACTIONS[is_maker]
+
+
+def calculate_trading_fees_batch(notionals, maker_mask) -> np.ndarray:
+    """
+    Vectorized fee calculation over arrays of notionals.
+
+    Backtests and analytics can cost thousands of fills in one ufunc pass
+    instead of a Decimal object per fill; the Decimal API above remains
+    the boundary for live trading.
+
+    Args:
+        notionals: Array-like of trade notional values in USD
+        maker_mask: Array-like of bools, True where the fill was maker
+
+    Returns:
+        float64 array of fee amounts in USD
+    """
+    notionals = np.asarray(notionals, dtype=np.float64)
+    rates = np.where(
+        np.asarray(maker_mask, dtype=bool),
+        settings_fast.maker_fee_pct,
+        settings_fast.taker_fee_pct
+    )
+    return notionals * (rates / 100.0)
 
 
 def calculate_round_trip_cost(
@@ -41,15 +77,97 @@ def calculate_round_trip_cost(
     """
     notional = entry_price * qty
 
-    entry_fee = calculate_trading_fee(notional, maker_entry)
-    exit_fee = calculate_trading_fee(notional, maker_exit)
+    entry_fraction = _MAKER_FRACTION if maker_entry else _TAKER_FRACTION
+    exit_fraction = _MAKER_FRACTION if maker_exit else _TAKER_FRACTION
 
-    total_fees = entry_fee + exit_fee
-    total_fees_pct = (total_fees / notional) * Decimal("100")
+    total_fees = notional * (entry_fraction + exit_fraction)
+    # total_fees / notional is just the summed fractions — no division
+    total_fees_pct = (entry_fraction + exit_fraction) * _HUNDRED
 
     return (total_fees, total_fees_pct)
 
 
+def calculate_round_trip_cost_batch(
+    entry_prices,
+    qtys,
+    maker_entry,
+    maker_exit
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized round-trip cost over arrays of candidate entries.
+
+    One fused multiply-add across the whole batch instead of a Python
+    call (and Decimal arithmetic) per candle.
+
+    Args:
+        entry_prices: Array-like of entry prices
+        qtys: Array-like of quantities
+        maker_entry: Array-like of bools, True where entry was maker
+        maker_exit: Array-like of bools, True where exit was maker
+
+    Returns:
+        (total_fees, total_fees_pct_of_notional) as float64 arrays
+    """
+    entry_prices = np.asarray(entry_prices, dtype=np.float64)
+    qtys = np.asarray(qtys, dtype=np.float64)
+    fraction_sum = (
+        np.where(np.asarray(maker_entry, dtype=bool), _MAKER_FRACTION_F, _TAKER_FRACTION_F)
+        + np.where(np.asarray(maker_exit, dtype=bool), _MAKER_FRACTION_F, _TAKER_FRACTION_F)
+    )
+    total_fees = entry_prices * qtys * fraction_sum
+    return (total_fees, fraction_sum * 100.0)
+
+
+def calculate_round_trip_cost_fast(
+    entry_price: float,
+    qty: float,
+    maker_entry: bool = True,
+    maker_exit: bool = True
+) -> Tuple[float, float]:
+    """
+    Float fast path of calculate_round_trip_cost for backtest loops.
+
+    Double precision is ample for fee percentages; live trading keeps
+    the Decimal version above.
+
+    Args:
+        entry_price: Entry price
+        qty: Quantity
+        maker_entry: Entry was maker order
+        maker_exit: Exit was maker order
+
+    Returns:
+        (total_fees, total_fees_pct_of_notional)
+    """
+    entry_fraction = _MAKER_FRACTION_F if maker_entry else _TAKER_FRACTION_F
+    exit_fraction = _MAKER_FRACTION_F if maker_exit else _TAKER_FRACTION_F
+
+    total_fees = entry_price * qty * (entry_fraction + exit_fraction)
+    total_fees_pct = (entry_fraction + exit_fraction) * 100.0
+
+    return (total_fees, total_fees_pct)
+
+
+def minimum_profitable_move_fast(
+    is_maker_entry: bool = True,
+    is_maker_exit: bool = True
+) -> float:
+    """
+    Float fast path of minimum_profitable_move for backtest loops.
+
+    Args:
+        is_maker_entry: Entry as maker
+        is_maker_exit: Exit as maker
+
+    Returns:
+        Minimum profitable move as percentage
+    """
+    entry_fraction = _MAKER_FRACTION_F if is_maker_entry else _TAKER_FRACTION_F
+    exit_fraction = _MAKER_FRACTION_F if is_maker_exit else _TAKER_FRACTION_F
+
+    return (entry_fraction + exit_fraction) * 100.0 / (1.0 - exit_fraction)
+
+
 def minimum_profitable_move(
     is_maker_entry: bool = True,
     is_maker_exit: bool = True
@@ -64,14 +182,14 @@ def minimum_profitable_move(
     Returns:
         Minimum profitable move as percentage
     """
-    entry_fee_pct = settings.maker_fee_pct if is_maker_entry else settings.taker_fee_pct
-    exit_fee_pct = settings.maker_fee_pct if is_maker_exit else settings.taker_fee_pct
+    entry_fraction = _MAKER_FRACTION if is_maker_entry else _TAKER_FRACTION
+    exit_fraction = _MAKER_FRACTION if is_maker_exit else _TAKER_FRACTION
 
     # Total fees as % of notional
-    total_fee_pct = entry_fee_pct + exit_fee_pct
+    total_fee_pct = (entry_fraction + exit_fraction) * _HUNDRED
 
     # Need to overcome fees plus make them back on exit
     # Simplified: need to gain > fees / (1 - exit_fee)
-    min_move_pct = total_fee_pct / (Decimal("1") - exit_fee_pct / Decimal("100"))
+    min_move_pct = total_fee_pct / (_ONE - exit_fraction)
 
     return min_move_pct
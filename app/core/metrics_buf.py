@@ -0,0 +1,67 @@
+"""
+Shared Prometheus scrape buffer, written once per trader tick.
+
+The trader is the single writer: at the end of each tick it formats the
+full scrape body into a module-global buffer. ``/metrics`` serves a copy
+of that buffer, so Prometheus, Grafana and liveness probes never call
+into trader internals — a scrape is a memcpy. With one writer and
+GIL-atomic length updates no locking is needed.
+"""
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# The HELP/TYPE lines never change; one template % values_tuple call
+# builds the whole scrape body
+_METRICS_TMPL = (
+    "# HELP volharvester_equity_usd Current total equity in USD\n"
+    "# TYPE volharvester_equity_usd gauge\n"
+    "volharvester_equity_usd %s\n"
+    "# HELP volharvester_realized_pnl_usd Realized PnL in USD\n"
+    "# TYPE volharvester_realized_pnl_usd gauge\n"
+    "volharvester_realized_pnl_usd %s\n"
+    "# HELP volharvester_unrealized_pnl_usd Unrealized PnL in USD\n"
+    "# TYPE volharvester_unrealized_pnl_usd gauge\n"
+    "volharvester_unrealized_pnl_usd %s\n"
+    "# HELP volharvester_total_trades Total number of trades\n"
+    "# TYPE volharvester_total_trades counter\n"
+    "volharvester_total_trades %s\n"
+    "# HELP volharvester_win_rate Win rate percentage\n"
+    "# TYPE volharvester_win_rate gauge\n"
+    "volharvester_win_rate %s\n"
+    "# HELP volharvester_drawdown_pct Current drawdown percentage\n"
+    "# TYPE volharvester_drawdown_pct gauge\n"
+    "volharvester_drawdown_pct %s\n"
+    "# HELP volharvester_paused Whether trading is paused\n"
+    "# TYPE volharvester_paused gauge\n"
+    "volharvester_paused %s\n"
+)
+
+_STATUS_BUF = bytearray(4096)
+_STATUS_LEN = 0
+
+
+def publish(status: dict) -> None:
+    """Format a trader status dict into the buffer (single writer only)."""
+    global _STATUS_LEN
+    body = (_METRICS_TMPL % (
+        status["equity"],
+        status["realized_pnl"],
+        status["unrealized_pnl"],
+        status["total_trades"],
+        status["win_rate"],
+        status["drawdown_pct"],
+        1 if status["paused"] else 0
+    )).encode()
+    _STATUS_BUF[:len(body)] = body
+    _STATUS_LEN = len(body)
+
+
+def render() -> bytes:
+    """Copy of the latest scrape body; empty if nothing published yet."""
+    return bytes(_STATUS_BUF[:_STATUS_LEN])
+
+
+def clear() -> None:
+    """Drop the published body (called when the trader stops)."""
+    global _STATUS_LEN
+    _STATUS_LEN = 0
@@ -1,35 +1,46 @@
 """
 Database models and dataclasses for the trading system.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, Numeric, DateTime, Boolean, Text, JSON, ForeignKey, Index, Enum as SQLEnum, insert
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from decimal import Decimal
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
+import numpy as np
 from .enums import Side, OrderType, OrderStatus, PositionStatus, TradingMode, StrategyState
 
 Base = declarative_base()
 
+# On Postgres store JSON as jsonb (binary, no re-parse on read, indexable
+# predicates); other dialects (SQLite tests) keep generic JSON
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Candle(Base):
     """OHLCV candle data."""
     __tablename__ = "candles"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    symbol = Column(String(20), nullable=False, index=True)
-    ts = Column(DateTime, nullable=False, index=True)
-    open = Column(Float, nullable=False)
-    high = Column(Float, nullable=False)
-    low = Column(Float, nullable=False)
-    close = Column(Float, nullable=False)
-    volume = Column(Float, nullable=False)
+    symbol = Column(String(20), nullable=False)
+    ts = Column(DateTime, nullable=False)
+    open = Column(Numeric(18, 8), nullable=False)
+    high = Column(Numeric(18, 8), nullable=False)
+    low = Column(Numeric(18, 8), nullable=False)
+    close = Column(Numeric(18, 8), nullable=False)
+    volume = Column(Numeric(18, 8), nullable=False)
     source = Column(String(50), nullable=False)  # exchange or 'backtest'
     timeframe = Column(String(10), nullable=False)  # 1m, 5m, 15m, etc.
 
+    # Every realistic query is WHERE symbol=? AND timeframe=? AND ts
+    # BETWEEN ? ORDER BY ts; one composite b-tree serves all three
+    # predicates and the sort in a single range scan. Unique so the
+    # database itself enforces one candle per (symbol, timeframe, ts)
+    # and ON CONFLICT DO NOTHING inserts have a constraint to land on.
     __table_args__ = (
-        {"schema": None}
+        Index("ix_candles_symbol_tf_ts", "symbol", "timeframe", "ts", unique=True),
     )
 
 
@@ -40,11 +51,11 @@ class Trade(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     ts = Column(DateTime, nullable=False, index=True)
     side = Column(SQLEnum(Side), nullable=False)
-    qty = Column(Float, nullable=False)
-    price = Column(Float, nullable=False)
-    fee = Column(Float, nullable=False)
+    qty = Column(Numeric(18, 8), nullable=False)
+    price = Column(Numeric(18, 8), nullable=False)
+    fee = Column(Numeric(18, 8), nullable=False)
     fee_asset = Column(String(10), nullable=False)
-    pnl = Column(Float, nullable=True)  # Realized PnL for this trade
+    pnl = Column(Numeric(18, 8), nullable=True)  # Realized PnL for this trade
     run_id = Column(Integer, ForeignKey("runs.id"), nullable=True, index=True)
     mode = Column(SQLEnum(TradingMode), nullable=False)
     position_id = Column(Integer, ForeignKey("positions.id"), nullable=True, index=True)
@@ -63,10 +74,10 @@ class Order(Base):
     side = Column(SQLEnum(Side), nullable=False)
     order_type = Column(SQLEnum(OrderType), nullable=False)
     status = Column(SQLEnum(OrderStatus), nullable=False, index=True)
-    qty = Column(Float, nullable=False)
-    price = Column(Float, nullable=True)  # Null for market orders
-    filled_qty = Column(Float, nullable=False, default=0.0)
-    filled_price = Column(Float, nullable=True)
+    qty = Column(Numeric(18, 8), nullable=False)
+    price = Column(Numeric(18, 8), nullable=True)  # Null for market orders
+    filled_qty = Column(Numeric(18, 8), nullable=False, default=0.0)
+    filled_price = Column(Numeric(18, 8), nullable=True)
     exchange_id = Column(String(100), nullable=True)  # Exchange order ID
     reason = Column(String(200), nullable=True)
     run_id = Column(Integer, ForeignKey("runs.id"), nullable=True, index=True)
@@ -85,15 +96,15 @@ class Position(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     ts_open = Column(DateTime, nullable=False, index=True)
     ts_close = Column(DateTime, nullable=True)
-    entry_price = Column(Float, nullable=False)
-    exit_price = Column(Float, nullable=True)
-    qty = Column(Float, nullable=False)
-    realized_pnl = Column(Float, nullable=True)
+    entry_price = Column(Numeric(18, 8), nullable=False)
+    exit_price = Column(Numeric(18, 8), nullable=True)
+    qty = Column(Numeric(18, 8), nullable=False)
+    realized_pnl = Column(Numeric(18, 8), nullable=True)
     realized_pnl_pct = Column(Float, nullable=True)
     status = Column(SQLEnum(PositionStatus), nullable=False, index=True)
     run_id = Column(Integer, ForeignKey("runs.id"), nullable=True, index=True)
     mode = Column(SQLEnum(TradingMode), nullable=False)
-    fees_paid = Column(Float, nullable=False, default=0.0)
+    fees_paid = Column(Numeric(18, 8), nullable=False, default=0.0)
     notes = Column(Text, nullable=True)
 
     run = relationship("Run", back_populates="positions")
@@ -108,7 +119,7 @@ class Run(Base):
     mode = Column(SQLEnum(TradingMode), nullable=False, index=True)
     started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     stopped_at = Column(DateTime, nullable=True)
-    config_json = Column(JSON, nullable=False)
+    config_json = Column(_JSON, nullable=False)
     notes = Column(Text, nullable=True)
     initial_capital = Column(Float, nullable=False)
     final_capital = Column(Float, nullable=True)
@@ -128,13 +139,41 @@ class State(Base):
     __tablename__ = "state"
 
     key = Column(String(100), primary_key=True)
-    value_json = Column(JSON, nullable=False)
+    value_json = Column(_JSON, nullable=False)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
-# Dataclasses for in-memory state management
+# Batch persistence helpers: one Core INSERT over the whole batch skips
+# the ORM unit-of-work per row and amortizes the round-trip/WAL sync,
+# which matters when a backtest writes thousands of rows at once
+
+def _bulk_insert(session, model, rows):
+    """Insert a batch of row dicts for model in one statement."""
+    if not rows:
+        return
+    session.execute(insert(model).values(rows))
+    session.commit()
+
+
+def bulk_insert_trades(session, rows):
+    """Bulk-insert trade row dicts."""
+    _bulk_insert(session, Trade, rows)
+
+
+def bulk_insert_orders(session, rows):
+    """Bulk-insert order row dicts."""
+    _bulk_insert(session, Order, rows)
+
+
+def bulk_insert_positions(session, rows):
+    """Bulk-insert position row dicts."""
+    _bulk_insert(session, Position, rows)
 
-@dataclass
+
+# Dataclasses for in-memory state management (slots=True: no per-instance
+# __dict__, attribute access is a fixed slot offset)
+
+@dataclass(slots=True)
 class StrategyStateData:
     """Strategy state data (persisted to DB)."""
     state: StrategyState = StrategyState.FLAT
@@ -158,9 +197,21 @@ class StrategyStateData:
     paused: bool = False
     pause_reason: Optional[str] = None
     last_update: datetime = field(default_factory=datetime.utcnow)
-
-
-@dataclass
+    # Float shadows of the equity fields above, refreshed alongside them
+    # (Portfolio.sync_state / RiskManager.update_drawdown). Per-tick risk
+    # checks compare these so the hot path never touches Decimal; 0.0
+    # means "not yet synced" and readers fall back to the Decimal field.
+    total_equity_f: float = 0.0
+    peak_equity_f: float = 0.0
+    current_drawdown_pct_f: float = 0.0
+    # Same idea for the signal state machine: the per-tick peak/trough
+    # tracking and threshold compares run on these
+    last_peak_f: float = 0.0
+    last_trough_f: float = 0.0
+    last_buy_price_f: float = 0.0
+
+
+@dataclass(slots=True)
 class MarketData:
     """Current market data snapshot."""
     symbol: str
@@ -169,21 +220,19 @@ class MarketData:
     ask: Decimal
     last: Decimal
     volume_24h: Optional[Decimal] = None
+    # Derived once at construction; read repeatedly per tick
+    mid: Decimal = field(init=False)
+    spread_bps: Decimal = field(init=False)
 
-    @property
-    def mid(self) -> Decimal:
-        """Mid price."""
-        return (self.bid + self.ask) / Decimal("2")
-
-    @property
-    def spread_bps(self) -> Decimal:
-        """Spread in basis points."""
+    def __post_init__(self):
+        self.mid = (self.bid + self.ask) / Decimal("2")
         if self.mid == 0:
-            return Decimal("0")
-        return ((self.ask - self.bid) / self.mid) * Decimal("10000")
+            self.spread_bps = Decimal("0")
+        else:
+            self.spread_bps = ((self.ask - self.bid) / self.mid) * Decimal("10000")
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """Trading signal."""
     timestamp: datetime
@@ -193,7 +242,7 @@ class Signal:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     """Order request."""
     side: Side
@@ -206,7 +255,26 @@ class OrderRequest:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
+class OHLCVArrays:
+    """
+    OHLCV candles in column (structure-of-arrays) layout.
+
+    Each field is a contiguous NumPy array rather than a list of per-candle
+    dicts, so vectorized indicator math can run over the columns directly.
+    """
+    ts: np.ndarray  # epoch milliseconds, int64
+    open: np.ndarray  # float64
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+@dataclass(slots=True)
 class OrderFill:
     """Order fill event."""
     order_id: str
@@ -9,6 +9,25 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Internal integer units: cash in cents, BTC in satoshis. Plain-int
+# arithmetic skips libmpdec entirely on the per-bar update path.
+_CENTS_PER_USD = 100
+_SATS_PER_BTC = 100_000_000
+_CENTS = Decimal(_CENTS_PER_USD)
+_SATS = Decimal(_SATS_PER_BTC)
+_HUNDRED = Decimal("100")
+_ZERO = Decimal("0")
+
+
+def _to_cents(value: Decimal) -> int:
+    """Convert a USD Decimal to integer cents (banker's rounding)."""
+    return int(round(value * _CENTS_PER_USD))
+
+
+def _to_sats(value: Decimal) -> int:
+    """Convert a BTC Decimal to integer satoshis (banker's rounding)."""
+    return int(round(value * _SATS_PER_BTC))
+
 
 class Portfolio:
     """
@@ -20,24 +39,63 @@ class Portfolio:
     - Total equity
     - Unrealized PnL
     - Realized PnL
+
+    State is held as integer cents/satoshis so the hot accounting path is
+    native int arithmetic; the public attributes stay Decimal via
+    properties, converting only at read/write.
     """
 
     def __init__(self, initial_cash: Decimal, initial_btc: Decimal = Decimal("0")):
-        self.cash = initial_cash
-        self.btc = initial_btc
-        self.initial_equity = initial_cash
-        self.realized_pnl = Decimal("0")
+        self._cash_cents = _to_cents(initial_cash)
+        self._btc_sats = _to_sats(initial_btc)
+        self._initial_equity_cents = self._cash_cents
+        self._realized_pnl_cents = 0
+
+    @property
+    def cash(self) -> Decimal:
+        """Cash balance in USD."""
+        return Decimal(self._cash_cents) / _CENTS
+
+    @cash.setter
+    def cash(self, value: Decimal):
+        self._cash_cents = _to_cents(value)
+
+    @property
+    def btc(self) -> Decimal:
+        """BTC position."""
+        return Decimal(self._btc_sats) / _SATS
+
+    @btc.setter
+    def btc(self, value: Decimal):
+        self._btc_sats = _to_sats(value)
+
+    @property
+    def initial_equity(self) -> Decimal:
+        """Equity at construction time."""
+        return Decimal(self._initial_equity_cents) / _CENTS
+
+    @property
+    def realized_pnl(self) -> Decimal:
+        """Realized PnL in USD."""
+        return Decimal(self._realized_pnl_cents) / _CENTS
+
+    def _equity_cents(self, price_cents: int) -> int:
+        """Total equity in cents for a price given in cents."""
+        return self._cash_cents + (self._btc_sats * price_cents) // _SATS_PER_BTC
 
     def get_equity(self, btc_price: Decimal) -> Decimal:
         """Calculate total equity (cash + BTC value)."""
-        return self.cash + (self.btc * btc_price)
+        return Decimal(self._equity_cents(_to_cents(btc_price))) / _CENTS
 
     def get_unrealized_pnl(self, btc_price: Decimal) -> Decimal:
         """Calculate unrealized PnL (BTC position value change)."""
-        btc_value = self.btc * btc_price
         # Unrealized PnL is current equity minus initial equity minus realized PnL
-        current_equity = self.get_equity(btc_price)
-        return current_equity - self.initial_equity - self.realized_pnl
+        pnl_cents = (
+            self._equity_cents(_to_cents(btc_price))
+            - self._initial_equity_cents
+            - self._realized_pnl_cents
+        )
+        return Decimal(pnl_cents) / _CENTS
 
     def execute_buy(self, qty: Decimal, price: Decimal, fee: Decimal) -> Decimal:
         """
@@ -51,16 +109,18 @@ class Portfolio:
         Returns:
             Total cost (notional + fee)
         """
-        cost = qty * price
-        total_cost = cost + fee
+        qty_sats = _to_sats(qty)
+        cost_cents = (qty_sats * _to_cents(price)) // _SATS_PER_BTC
+        total_cost_cents = cost_cents + _to_cents(fee)
 
-        if self.cash < total_cost:
-            raise ValueError(f"Insufficient cash: have ${self.cash:.2f}, need ${total_cost:.2f}")
+        if self._cash_cents < total_cost_cents:
+            raise ValueError(f"Insufficient cash: have ${self.cash:.2f}, need ${Decimal(total_cost_cents) / _CENTS:.2f}")
 
-        self.cash -= total_cost
-        self.btc += qty
+        self._cash_cents -= total_cost_cents
+        self._btc_sats += qty_sats
 
-        logger.info(f"Buy executed: {qty:.8f} BTC @ ${price:.2f}, cost=${total_cost:.2f} (fee=${fee:.2f})")
+        total_cost = Decimal(total_cost_cents) / _CENTS
+        logger.info("Buy executed: %.8f BTC @ $%.2f, cost=$%.2f (fee=$%.2f)", qty, price, total_cost, fee)
         return total_cost
 
     def execute_sell(self, qty: Decimal, price: Decimal, fee: Decimal) -> Decimal:
@@ -75,20 +135,22 @@ class Portfolio:
         Returns:
             Net proceeds (revenue - fee)
         """
-        if self.btc < qty:
+        qty_sats = _to_sats(qty)
+        if self._btc_sats < qty_sats:
             raise ValueError(f"Insufficient BTC: have {self.btc:.8f}, need {qty:.8f}")
 
-        revenue = qty * price
-        net_proceeds = revenue - fee
+        revenue_cents = (qty_sats * _to_cents(price)) // _SATS_PER_BTC
+        net_proceeds_cents = revenue_cents - _to_cents(fee)
 
-        self.btc -= qty
-        self.cash += net_proceeds
+        self._btc_sats -= qty_sats
+        self._cash_cents += net_proceeds_cents
 
         # Update realized PnL
         # This is simplified - in reality would track cost basis per position
-        self.realized_pnl += net_proceeds - (qty * price)  # Simplified
+        self._realized_pnl_cents += net_proceeds_cents - revenue_cents  # Simplified
 
-        logger.info(f"Sell executed: {qty:.8f} BTC @ ${price:.2f}, proceeds=${net_proceeds:.2f} (fee=${fee:.2f})")
+        net_proceeds = Decimal(net_proceeds_cents) / _CENTS
+        logger.info("Sell executed: %.8f BTC @ $%.2f, proceeds=$%.2f (fee=$%.2f)", qty, price, net_proceeds, fee)
         return net_proceeds
 
     def get_balances(self) -> Dict[str, Decimal]:
@@ -100,29 +162,41 @@ class Portfolio:
 
     def sync_state(self, state: StrategyStateData, btc_price: Decimal):
         """Sync portfolio data to strategy state."""
-        state.total_equity = self.get_equity(btc_price)
-        state.unrealized_pnl = self.get_unrealized_pnl(btc_price)
+        # Price the position once and derive equity and unrealized PnL
+        # from the same cents value
+        equity_cents = self._equity_cents(_to_cents(btc_price))
+        equity = Decimal(equity_cents) / _CENTS
+        state.total_equity = equity
+        state.unrealized_pnl = Decimal(
+            equity_cents - self._initial_equity_cents - self._realized_pnl_cents
+        ) / _CENTS
         state.realized_pnl = self.realized_pnl
         state.current_position_qty = self.btc
 
-        # Update peak equity and drawdown
-        if state.total_equity > state.peak_equity:
-            state.peak_equity = state.total_equity
+        # Update peak equity and drawdown in one pass
+        peak = state.peak_equity if state.peak_equity >= equity else equity
+        state.peak_equity = peak
+        state.current_drawdown_pct = (peak - equity) * _HUNDRED / peak if peak else _ZERO
 
-        if state.peak_equity > 0:
-            dd_pct = ((state.peak_equity - state.total_equity) / state.peak_equity) * Decimal("100")
-            state.current_drawdown_pct = dd_pct
-        else:
-            state.current_drawdown_pct = Decimal("0")
+        # Refresh the float shadows the risk checks read
+        equity_f = equity_cents / _CENTS_PER_USD
+        peak_f = float(peak)
+        state.total_equity_f = equity_f
+        state.peak_equity_f = peak_f
+        state.current_drawdown_pct_f = (peak_f - equity_f) / peak_f * 100.0 if peak_f else 0.0
 
     def to_dict(self, btc_price: Decimal) -> Dict:
         """Export portfolio snapshot."""
+        price_cents = _to_cents(btc_price)
+        btc_value_cents = (self._btc_sats * price_cents) // _SATS_PER_BTC
+        equity_cents = self._cash_cents + btc_value_cents
+        unrealized_cents = equity_cents - self._initial_equity_cents - self._realized_pnl_cents
         return {
-            "cash_usd": float(self.cash),
-            "btc_qty": float(self.btc),
-            "btc_value_usd": float(self.btc * btc_price),
-            "total_equity": float(self.get_equity(btc_price)),
-            "realized_pnl": float(self.realized_pnl),
-            "unrealized_pnl": float(self.get_unrealized_pnl(btc_price)),
-            "total_pnl": float(self.realized_pnl + self.get_unrealized_pnl(btc_price))
+            "cash_usd": self._cash_cents / 100,
+            "btc_qty": self._btc_sats / _SATS_PER_BTC,
+            "btc_value_usd": btc_value_cents / 100,
+            "total_equity": equity_cents / 100,
+            "realized_pnl": self._realized_pnl_cents / 100,
+            "unrealized_pnl": unrealized_cents / 100,
+            "total_pnl": (self._realized_pnl_cents + unrealized_cents) / 100
         }
@@ -6,11 +6,61 @@ from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from app.core.models import StrategyStateData, MarketData
 from app.core.enums import StrategyState, CircuitBreakerReason
-from app.core.config import settings
+from app.core.config import FastSettings, settings, settings_fast, _freeze
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Hot-path thresholds as plain floats/ints, bound once at import. The
+# per-tick checks compare against these instead of resolving pydantic
+# attributes and Decimal values on every call.
+_MAX_DRAWDOWN_PCT = settings_fast.max_drawdown_pct
+_DAILY_LOSS_LIMIT_PCT = settings_fast.daily_loss_limit_pct
+_MIN_ACTIVITY_PCT = settings_fast.min_activity_pct
+_MAX_ACTIVITY_PCT = settings_fast.max_activity_pct
+_MAX_CONSECUTIVE_LOSSES = settings_fast.max_consecutive_losses
+_MAX_SPREAD_BPS = float(settings_fast.max_spread_bps)
+_MAX_STALE_SECONDS = float(settings_fast.max_ws_stale_seconds)
+
+# Integer units for order-size validation, matching the portfolio's
+# internal cents/satoshis representation
+_CENTS_PER_USD = 100
+_SATS_PER_BTC = 100_000_000
+_SATS = Decimal(_SATS_PER_BTC)
+
+# fast_check return codes: 0 means all breakers pass; a nonzero code
+# names the tripped breaker. Reason strings are built only on a trip.
+_OK = 0
+_TRIP_STALE = 1
+_TRIP_SPREAD = 2
+_TRIP_LOSSES = 3
+_TRIP_LOW_VOL = 4
+_TRIP_HIGH_VOL = 5
+_TRIP_DRAWDOWN = 6
+_TRIP_DAILY_LOSS = 7
+
+
+def reload_settings(snapshot: Optional[FastSettings] = None):
+    """
+    Rebind the module-level threshold constants.
+
+    Settings are effectively immutable in normal operation; call this
+    after mutating them (tests, admin reconfiguration) so the hot-path
+    constants track the new values.
+    """
+    global _MAX_DRAWDOWN_PCT, _DAILY_LOSS_LIMIT_PCT, _MIN_ACTIVITY_PCT, \
+        _MAX_ACTIVITY_PCT, _MAX_CONSECUTIVE_LOSSES, _MAX_SPREAD_BPS, \
+        _MAX_STALE_SECONDS
+    s = snapshot if snapshot is not None else _freeze(settings)
+    _MAX_DRAWDOWN_PCT = s.max_drawdown_pct
+    _DAILY_LOSS_LIMIT_PCT = s.daily_loss_limit_pct
+    _MIN_ACTIVITY_PCT = s.min_activity_pct
+    _MAX_ACTIVITY_PCT = s.max_activity_pct
+    _MAX_CONSECUTIVE_LOSSES = s.max_consecutive_losses
+    _MAX_SPREAD_BPS = float(s.max_spread_bps)
+    _MAX_STALE_SECONDS = float(s.max_ws_stale_seconds)
+
 
 class RiskManager:
     """
@@ -28,6 +78,12 @@ class RiskManager:
     def __init__(self):
         self.daily_pnl_reset_time: Optional[datetime] = None
         self.daily_pnl: Decimal = Decimal("0")
+        # Float shadow of daily_pnl for the per-tick limit check; the
+        # Decimal stays authoritative for audit/reporting
+        self.daily_pnl_f: float = 0.0
+        # Day ordinal of the last daily-PnL reset: the common no-reset
+        # branch is then a single int compare
+        self._daily_reset_ordinal: int = -1
 
     def check_drawdown(self, state: StrategyStateData) -> Tuple[bool, Optional[str]]:
         """
@@ -36,14 +92,18 @@ class RiskManager:
         Returns:
             (should_pause, reason)
         """
-        if state.peak_equity == 0:
+        # Compare the float shadow; fall back to the Decimal field if the
+        # shadow has not been synced yet
+        if state.peak_equity_f:
+            current_dd_pct = state.current_drawdown_pct_f
+        elif state.peak_equity:
+            current_dd_pct = float(state.current_drawdown_pct)
+        else:
             return (False, None)
 
-        current_dd_pct = state.current_drawdown_pct
-
-        if current_dd_pct >= settings.max_drawdown_pct:
-            reason = f"Drawdown {current_dd_pct:.2f}% exceeds limit {settings.max_drawdown_pct:.2f}%"
-            logger.warning(f"Circuit breaker: {reason}")
+        if current_dd_pct >= _MAX_DRAWDOWN_PCT:
+            reason = f"Drawdown {current_dd_pct:.2f}% exceeds limit {_MAX_DRAWDOWN_PCT:.2f}%"
+            logger.warning("Circuit breaker: %s", reason)
             return (True, reason)
 
         return (False, None)
@@ -55,37 +115,53 @@ class RiskManager:
         Returns:
             (should_pause, reason)
         """
-        if state.consecutive_losses >= settings.max_consecutive_losses:
-            reason = f"Consecutive losses {state.consecutive_losses} exceeds limit {settings.max_consecutive_losses}"
-            logger.warning(f"Circuit breaker: {reason}")
+        if state.consecutive_losses >= _MAX_CONSECUTIVE_LOSSES:
+            reason = f"Consecutive losses {state.consecutive_losses} exceeds limit {_MAX_CONSECUTIVE_LOSSES}"
+            logger.warning("Circuit breaker: %s", reason)
             return (True, reason)
 
         return (False, None)
 
-    def check_daily_loss_limit(self, state: StrategyStateData) -> Tuple[bool, Optional[str]]:
+    def check_daily_loss_limit(
+        self,
+        state: StrategyStateData,
+        now: Optional[datetime] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Check if daily loss exceeds limit.
 
+        `now` lets the tick handler pass one timestamp through all the
+        breaker checks instead of each check calling utcnow() itself.
+
         Returns:
             (should_pause, reason)
         """
-        now = datetime.utcnow()
+        if now is None:
+            now = datetime.utcnow()
 
         # Reset daily PnL at midnight UTC
-        if self.daily_pnl_reset_time is None or now.date() > self.daily_pnl_reset_time.date():
+        ordinal = now.toordinal()
+        if ordinal > self._daily_reset_ordinal:
             self.daily_pnl = Decimal("0")
+            self.daily_pnl_f = 0.0
             self.daily_pnl_reset_time = now
+            self._daily_reset_ordinal = ordinal
             logger.debug("Reset daily PnL counter")
 
+        # Profitable or flat days can never trip the limit
+        if self.daily_pnl_f >= 0.0:
+            return (False, None)
+
         # Calculate daily loss percentage
-        if state.total_equity == 0:
+        equity_f = state.total_equity_f or float(state.total_equity)
+        if equity_f == 0.0:
             return (False, None)
 
-        daily_loss_pct = abs(self.daily_pnl / state.total_equity * Decimal("100"))
+        daily_loss_pct = -self.daily_pnl_f / equity_f * 100.0
 
-        if self.daily_pnl < 0 and daily_loss_pct >= settings.daily_loss_limit_pct:
-            reason = f"Daily loss {daily_loss_pct:.2f}% exceeds limit {settings.daily_loss_limit_pct:.2f}%"
-            logger.warning(f"Circuit breaker: {reason}")
+        if daily_loss_pct >= _DAILY_LOSS_LIMIT_PCT:
+            reason = f"Daily loss {daily_loss_pct:.2f}% exceeds limit {_DAILY_LOSS_LIMIT_PCT:.2f}%"
+            logger.warning("Circuit breaker: %s", reason)
             return (True, reason)
 
         return (False, None)
@@ -93,29 +169,40 @@ class RiskManager:
     def update_daily_pnl(self, pnl: Decimal):
         """Update daily PnL tracker."""
         self.daily_pnl += pnl
-        logger.debug(f"Daily PnL: ${self.daily_pnl:.2f}")
+        self.daily_pnl_f = float(self.daily_pnl)
+        # Guarded: Decimal.__format__ is slow enough to matter per fill
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Daily PnL: ${self.daily_pnl:.2f}")
 
-    def check_volatility_bounds(self, atr_pct: Optional[Decimal]) -> Tuple[bool, Optional[str]]:
+    def check_volatility_bounds(
+        self,
+        atr_pct: Optional[Decimal]
+    ) -> Tuple[bool, Optional[CircuitBreakerReason], Optional[str]]:
         """
         Check if volatility is within acceptable bounds.
 
+        Returns the tripped bound as an enum directly, so the caller does
+        not have to infer low vs high from the reason text.
+
         Returns:
-            (should_pause, reason)
+            (should_pause, reason_enum, reason_text)
         """
         if atr_pct is None:
-            return (False, None)
+            return (False, None, None)
 
-        if atr_pct < settings.min_activity_pct:
-            reason = f"ATR {atr_pct:.2f}% below minimum {settings.min_activity_pct:.2f}% (too choppy)"
-            logger.warning(f"Circuit breaker: {reason}")
-            return (True, reason)
+        atr_f = float(atr_pct)
 
-        if atr_pct > settings.max_activity_pct:
-            reason = f"ATR {atr_pct:.2f}% above maximum {settings.max_activity_pct:.2f}% (too volatile)"
-            logger.warning(f"Circuit breaker: {reason}")
-            return (True, reason)
+        if atr_f < _MIN_ACTIVITY_PCT:
+            reason = f"ATR {atr_f:.2f}% below minimum {_MIN_ACTIVITY_PCT:.2f}% (too choppy)"
+            logger.warning("Circuit breaker: %s", reason)
+            return (True, CircuitBreakerReason.LOW_VOLATILITY, reason)
 
-        return (False, None)
+        if atr_f > _MAX_ACTIVITY_PCT:
+            reason = f"ATR {atr_f:.2f}% above maximum {_MAX_ACTIVITY_PCT:.2f}% (too volatile)"
+            logger.warning("Circuit breaker: %s", reason)
+            return (True, CircuitBreakerReason.HIGH_VOLATILITY, reason)
+
+        return (False, None, None)
 
     def check_spread(self, market_data: MarketData) -> Tuple[bool, Optional[str]]:
         """
@@ -124,89 +211,168 @@ class RiskManager:
         Returns:
             (should_pause, reason)
         """
-        spread_bps = market_data.spread_bps
+        spread_bps = float(market_data.spread_bps)
 
-        if spread_bps > settings.max_spread_bps:
-            reason = f"Spread {spread_bps:.1f} bps exceeds limit {settings.max_spread_bps} bps"
-            logger.warning(f"Circuit breaker: {reason}")
+        if spread_bps > _MAX_SPREAD_BPS:
+            reason = f"Spread {spread_bps:.1f} bps exceeds limit {_MAX_SPREAD_BPS:.0f} bps"
+            logger.warning("Circuit breaker: %s", reason)
             return (True, reason)
 
         return (False, None)
 
-    def check_stale_data(self, last_heartbeat: Optional[datetime]) -> Tuple[bool, Optional[str]]:
+    def check_stale_data(
+        self,
+        last_heartbeat: float,
+        now_mono: Optional[float] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Check if data is stale (WebSocket lag).
 
+        `last_heartbeat` is a time.monotonic() timestamp (0.0 = never
+        seen); `now_mono` lets the tick handler reuse one clock read
+        across the breaker chain.
+
         Returns:
             (should_pause, reason)
         """
-        if last_heartbeat is None:
+        if not last_heartbeat:
             return (True, "No heartbeat received")
 
-        time_since_heartbeat = (datetime.utcnow() - last_heartbeat).total_seconds()
+        if now_mono is None:
+            now_mono = time.monotonic()
+        time_since_heartbeat = now_mono - last_heartbeat
 
-        if time_since_heartbeat > settings.max_ws_stale_seconds:
-            reason = f"Data stale for {time_since_heartbeat:.1f}s (limit {settings.max_ws_stale_seconds}s)"
-            logger.warning(f"Circuit breaker: {reason}")
+        if time_since_heartbeat > _MAX_STALE_SECONDS:
+            reason = f"Data stale for {time_since_heartbeat:.1f}s (limit {_MAX_STALE_SECONDS:.0f}s)"
+            logger.warning("Circuit breaker: %s", reason)
             return (True, reason)
 
         return (False, None)
 
+    def fast_check(
+        self,
+        state: StrategyStateData,
+        market_data: MarketData,
+        last_heartbeat: float,
+        now: datetime
+    ) -> int:
+        """
+        Evaluate every circuit breaker in one function.
+
+        The per-check methods each cost a call frame and build their
+        reason string eagerly; this inlines all the compares against the
+        module constants and returns a small int code (_OK or _TRIP_*),
+        so the healthy tick is a handful of comparisons in one frame.
+        Breakers are ordered cheapest and most-likely-to-trip first:
+        stale data and wide spreads fire far more often in production
+        than drawdown. The verdicts match the per-check methods exactly.
+        """
+        # Stale data
+        if not last_heartbeat or time.monotonic() - last_heartbeat > _MAX_STALE_SECONDS:
+            return _TRIP_STALE
+
+        # Spread
+        if float(market_data.spread_bps) > _MAX_SPREAD_BPS:
+            return _TRIP_SPREAD
+
+        # Consecutive losses
+        if state.consecutive_losses >= _MAX_CONSECUTIVE_LOSSES:
+            return _TRIP_LOSSES
+
+        # Volatility bounds
+        if state.atr_pct is not None:
+            atr_f = float(state.atr_pct)
+            if atr_f < _MIN_ACTIVITY_PCT:
+                return _TRIP_LOW_VOL
+            if atr_f > _MAX_ACTIVITY_PCT:
+                return _TRIP_HIGH_VOL
+
+        # Drawdown (float shadow first, Decimal fallback)
+        if state.peak_equity_f:
+            if state.current_drawdown_pct_f >= _MAX_DRAWDOWN_PCT:
+                return _TRIP_DRAWDOWN
+        elif state.peak_equity and float(state.current_drawdown_pct) >= _MAX_DRAWDOWN_PCT:
+            return _TRIP_DRAWDOWN
+
+        # Daily loss limit; the midnight reset lives here so the fast
+        # path stays a valid per-tick entry point on its own
+        ordinal = now.toordinal()
+        if ordinal > self._daily_reset_ordinal:
+            self.daily_pnl = Decimal("0")
+            self.daily_pnl_f = 0.0
+            self.daily_pnl_reset_time = now
+            self._daily_reset_ordinal = ordinal
+
+        if self.daily_pnl_f < 0.0:
+            equity_f = state.total_equity_f or float(state.total_equity)
+            if equity_f and -self.daily_pnl_f / equity_f * 100.0 >= _DAILY_LOSS_LIMIT_PCT:
+                return _TRIP_DAILY_LOSS
+
+        return _OK
+
     def check_all_circuit_breakers(
         self,
         state: StrategyStateData,
         market_data: MarketData,
-        last_heartbeat: Optional[datetime]
+        last_heartbeat: float,
+        now: Optional[datetime] = None
     ) -> Tuple[bool, Optional[CircuitBreakerReason], Optional[str]]:
         """
         Check all circuit breakers.
 
+        Delegates the verdict to fast_check; the tripped breaker's
+        individual method is re-run only on the rare trip path, where
+        building (and logging) the reason string is worth paying for.
+
         Returns:
             (should_pause, reason_enum, reason_text)
         """
-        # Check drawdown
-        should_pause, reason = self.check_drawdown(state)
-        if should_pause:
-            return (True, CircuitBreakerReason.MAX_DRAWDOWN, reason)
-
-        # Check consecutive losses
-        should_pause, reason = self.check_consecutive_losses(state)
-        if should_pause:
-            return (True, CircuitBreakerReason.CONSECUTIVE_LOSSES, reason)
+        if now is None:
+            now = datetime.utcnow()
 
-        # Check daily loss limit
-        should_pause, reason = self.check_daily_loss_limit(state)
-        if should_pause:
-            return (True, CircuitBreakerReason.DAILY_LOSS_LIMIT, reason)
-
-        # Check volatility bounds
-        should_pause, reason = self.check_volatility_bounds(state.atr_pct)
-        if should_pause:
-            if "too choppy" in reason.lower():
-                return (True, CircuitBreakerReason.LOW_VOLATILITY, reason)
-            else:
-                return (True, CircuitBreakerReason.HIGH_VOLATILITY, reason)
+        code = self.fast_check(state, market_data, last_heartbeat, now)
+        if code == _OK:
+            return (False, None, None)
 
-        # Check spread
-        should_pause, reason = self.check_spread(market_data)
-        if should_pause:
-            return (True, CircuitBreakerReason.SPREAD_TOO_WIDE, reason)
-
-        # Check stale data
-        should_pause, reason = self.check_stale_data(last_heartbeat)
-        if should_pause:
+        if code == _TRIP_STALE:
+            _, reason = self.check_stale_data(last_heartbeat)
             return (True, CircuitBreakerReason.STALE_DATA, reason)
+        if code == _TRIP_SPREAD:
+            _, reason = self.check_spread(market_data)
+            return (True, CircuitBreakerReason.SPREAD_TOO_WIDE, reason)
+        if code == _TRIP_LOSSES:
+            _, reason = self.check_consecutive_losses(state)
+            return (True, CircuitBreakerReason.CONSECUTIVE_LOSSES, reason)
+        if code in (_TRIP_LOW_VOL, _TRIP_HIGH_VOL):
+            _, cb_reason, reason = self.check_volatility_bounds(state.atr_pct)
+            return (True, cb_reason, reason)
+        if code == _TRIP_DRAWDOWN:
+            _, reason = self.check_drawdown(state)
+            return (True, CircuitBreakerReason.MAX_DRAWDOWN, reason)
 
-        return (False, None, None)
+        # _TRIP_DAILY_LOSS
+        _, reason = self.check_daily_loss_limit(state, now)
+        return (True, CircuitBreakerReason.DAILY_LOSS_LIMIT, reason)
 
     def update_drawdown(self, state: StrategyStateData):
-        """Update drawdown calculation."""
-        if state.total_equity > state.peak_equity:
+        """
+        Update drawdown calculation.
+
+        Runs in float over the equity shadows; the Decimal record is
+        maintained by Portfolio.sync_state, and only a new peak (rare)
+        touches the Decimal fields here.
+        """
+        equity_f = state.total_equity_f or float(state.total_equity)
+        peak_f = state.peak_equity_f or float(state.peak_equity)
+
+        if equity_f > peak_f:
             state.peak_equity = state.total_equity
+            state.peak_equity_f = equity_f
             state.current_drawdown_pct = Decimal("0")
-        elif state.peak_equity > 0:
-            dd = (state.peak_equity - state.total_equity) / state.peak_equity * Decimal("100")
-            state.current_drawdown_pct = dd
+            state.current_drawdown_pct_f = 0.0
+        elif peak_f > 0.0:
+            state.peak_equity_f = peak_f
+            state.current_drawdown_pct_f = (peak_f - equity_f) / peak_f * 100.0
 
     def validate_order_size(
         self,
@@ -218,27 +384,41 @@ class RiskManager:
         """
         Validate and adjust order size.
 
+        Runs in integer satoshis/cents — the portfolio's internal units —
+        so the per-order path is plain int arithmetic; Decimal appears
+        only at the boundaries.
+
         Returns:
             (is_valid, error_reason, adjusted_qty)
         """
+        qty_sats = int(qty * _SATS_PER_BTC)
+        price_cents = int(price * _CENTS_PER_USD)
+        min_notional_cents = int(min_notional * _CENTS_PER_USD)
+        lot_sats = int(lot_size * _SATS_PER_BTC) or 1
+
         # Check minimum notional
-        notional = qty * price
-        if notional < min_notional:
-            return (False, f"Notional ${notional:.2f} below minimum ${min_notional:.2f}", Decimal("0"))
+        notional_cents = qty_sats * price_cents // _SATS_PER_BTC
+        if notional_cents < min_notional_cents:
+            return (
+                False,
+                f"Notional ${notional_cents / _CENTS_PER_USD:.2f} below minimum "
+                f"${min_notional_cents / _CENTS_PER_USD:.2f}",
+                Decimal("0")
+            )
 
         # Round to lot size
-        adjusted_qty = (qty // lot_size) * lot_size
+        adjusted_sats = (qty_sats // lot_sats) * lot_sats
 
-        if adjusted_qty <= 0:
+        if adjusted_sats <= 0:
             return (False, "Quantity too small after rounding to lot size", Decimal("0"))
 
-        return (True, None, adjusted_qty)
+        return (True, None, Decimal(adjusted_sats) / _SATS)
 
     def should_flatten_position(
         self,
         state: StrategyStateData,
         market_data: MarketData,
-        last_heartbeat: Optional[datetime]
+        last_heartbeat: float
     ) -> Tuple[bool, Optional[str]]:
         """
         Determine if position should be flattened immediately (emergency exit).
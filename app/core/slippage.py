@@ -2,7 +2,51 @@
 Slippage estimation for backtesting.
 """
 from decimal import Decimal
-from app.core.config import settings
+from functools import lru_cache
+from app.core.config import settings_fast
+
+# Base taker slippage in bps, bound once at import
+_BASE_SLIPPAGE_BPS = float(settings_fast.taker_slippage_bps)
+
+# Fraction cache granularity: ATR bucketed to 0.01%. ATR moves slowly, so
+# backtests hit the same bucket for long stretches of bars.
+_ATR_BUCKETS_PER_PCT = 100
+
+_ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=1024)
+def _slippage_fraction(atr_bucket: int) -> float:
+    """Total taker slippage as a price fraction for a bucketed ATR."""
+    volatility_bps = atr_bucket / _ATR_BUCKETS_PER_PCT
+    return (_BASE_SLIPPAGE_BPS + volatility_bps) / 10000.0
+
+
+def estimate_slippage_fast(
+    price: float,
+    qty: float,
+    atr_pct: float,
+    is_maker: bool = True
+) -> float:
+    """Float path of estimate_slippage for per-bar simulation loops."""
+    if is_maker:
+        return 0.0
+    return price * qty * _slippage_fraction(int(atr_pct * _ATR_BUCKETS_PER_PCT))
+
+
+def adjust_fill_price_for_slippage_fast(
+    price: float,
+    side: str,
+    atr_pct: float,
+    is_maker: bool = True
+) -> float:
+    """Float path of adjust_fill_price_for_slippage for simulation loops."""
+    if is_maker:
+        return price
+    fraction = _slippage_fraction(int(atr_pct * _ATR_BUCKETS_PER_PCT))
+    if side == "buy":
+        return price * (1.0 + fraction)
+    return price * (1.0 - fraction)
 
 
 def estimate_slippage(
@@ -17,6 +61,9 @@ def estimate_slippage(
     For maker orders: minimal slippage (already in the book)
     For taker orders: slippage scales with volatility
 
+    Internally runs in float (sub-cent precision is noise here); Decimal
+    appears only at the API boundary.
+
     Args:
         price: Order price
         qty: Order quantity
@@ -28,18 +75,9 @@ def estimate_slippage(
     """
     if is_maker:
         # Maker orders get price improvement or no slippage
-        return Decimal("0")
+        return _ZERO
 
-    # Taker slippage: base + volatility component
-    base_slippage_bps = settings.taker_slippage_bps
-    volatility_slippage_bps = (atr_pct / Decimal("5")) * Decimal("5")  # Scale with volatility
-
-    total_slippage_bps = base_slippage_bps + volatility_slippage_bps
-
-    slippage_pct = total_slippage_bps / Decimal("10000")
-    slippage_usd = price * qty * slippage_pct
-
-    return slippage_usd
+    return Decimal(str(estimate_slippage_fast(float(price), float(qty), float(atr_pct), False)))
 
 
 def adjust_fill_price_for_slippage(
@@ -63,14 +101,4 @@ def adjust_fill_price_for_slippage(
     if is_maker:
         return price  # No adjustment for maker
 
-    base_slippage_bps = settings.taker_slippage_bps
-    volatility_slippage_bps = (atr_pct / Decimal("5")) * Decimal("5")
-    total_slippage_bps = base_slippage_bps + volatility_slippage_bps
-    slippage_pct = total_slippage_bps / Decimal("10000")
-
-    if side == "buy":
-        # Pay more when buying
-        return price * (Decimal("1") + slippage_pct)
-    else:
-        # Receive less when selling
-        return price * (Decimal("1") - slippage_pct)
+    return Decimal(str(adjust_fill_price_for_slippage_fast(float(price), side, float(atr_pct), False)))
@@ -8,14 +8,142 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass, field
+from functools import lru_cache
 from app.core.models import StrategyStateData, MarketData, Signal
 from app.core.enums import StrategyState, SignalType
-from app.core.config import settings
+from app.core.config import settings, settings_fast
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _adapted_threshold(atr_bucket: int, min_swing: float, max_swing: float) -> Decimal:
+    """
+    Adapted swing threshold for a 0.01%-bucketed ATR.
+
+    ATR drifts slowly, so consecutive ticks land in the same bucket and
+    the interpolation plus the Decimal wrap are paid once per bucket.
+    """
+    atr = atr_bucket / 100.0
+    if atr <= 2.0:
+        adapted = min_swing
+    elif atr >= 6.0:
+        adapted = max_swing
+    else:
+        adapted = min_swing + (atr - 2.0) / 4.0 * (max_swing - min_swing)
+    return Decimal(str(adapted))
+
+
+def _atr_from_arrays(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """ATR as a percentage of the latest close, from float64 arrays."""
+    prev_close = close[:-1]
+    true_range = np.maximum(
+        high[1:] - low[1:],
+        np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+    )
+    current_price = close[-1]
+    if current_price == 0:
+        return 0.0
+    return true_range[-period:].mean() / current_price * 100.0
+
+
+def _atr_ma_scan(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    ma_short_n: int,
+    ma_long_n: int
+) -> Tuple[float, float, float]:
+    """
+    Fused indicator pass: ATR%, short MA and long MA from one set of
+    column pulls, so the signal path touches each candle column once
+    instead of scanning close for the ATR and twice more for the MAs.
+    """
+    # Only the trailing period+1 bars feed the ATR mean — compute on
+    # that view rather than the whole window
+    n = period + 1
+    atr_pct = _atr_from_arrays(high[-n:], low[-n:], close[-n:], period)
+    return (atr_pct, close[-ma_short_n:].mean(), close[-ma_long_n:].mean())
+
+
+@dataclass(slots=True)
+class IndicatorState:
+    """
+    Incremental rolling-indicator state.
+
+    Ring buffers hold the trailing true ranges and closes; each new candle
+    evicts the oldest value and adds the new one, so ATR and both moving
+    averages update in O(1) per candle instead of rescanning the history.
+    """
+    atr_period: int
+    ma_short_n: int
+    ma_long_n: int
+    tr_window: np.ndarray = field(init=False)
+    close_short: np.ndarray = field(init=False)
+    close_long: np.ndarray = field(init=False)
+    tr_sum: float = field(init=False, default=0.0)
+    short_sum: float = field(init=False, default=0.0)
+    long_sum: float = field(init=False, default=0.0)
+    tr_idx: int = field(init=False, default=0)
+    short_idx: int = field(init=False, default=0)
+    long_idx: int = field(init=False, default=0)
+    count: int = field(init=False, default=0)
+    last_close: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.tr_window = np.zeros(self.atr_period)
+        self.close_short = np.zeros(self.ma_short_n)
+        self.close_long = np.zeros(self.ma_long_n)
+
+    def update(self, high: float, low: float, close: float):
+        """Fold one closed candle into the rolling windows."""
+        if self.count:
+            prev = self.last_close
+            tr = max(high - low, abs(high - prev), abs(low - prev))
+            i = self.tr_idx
+            self.tr_sum += tr - self.tr_window[i]
+            self.tr_window[i] = tr
+            self.tr_idx = (i + 1) % self.atr_period
+
+        i = self.short_idx
+        self.short_sum += close - self.close_short[i]
+        self.close_short[i] = close
+        self.short_idx = (i + 1) % self.ma_short_n
+
+        i = self.long_idx
+        self.long_sum += close - self.close_long[i]
+        self.close_long[i] = close
+        self.long_idx = (i + 1) % self.ma_long_n
+
+        self.last_close = close
+        self.count += 1
+
+    @property
+    def atr_ready(self) -> bool:
+        """Enough candles seen to fill the true-range window."""
+        return self.count > self.atr_period
+
+    @property
+    def trend_ready(self) -> bool:
+        """Enough candles seen to fill the long moving-average window."""
+        return self.count >= self.ma_long_n
+
+    @property
+    def atr_pct(self) -> float:
+        """ATR as a percentage of the latest close."""
+        if self.last_close == 0.0:
+            return 0.0
+        return self.tr_sum / self.atr_period / self.last_close * 100.0
+
+    @property
+    def trend_up(self) -> bool:
+        """Short MA above long MA (cross-multiplied to skip the divisions)."""
+        return self.short_sum * self.ma_long_n > self.long_sum * self.ma_short_n
+
+
 class VolatilityHarvester:
     """
     Volatility harvesting strategy implementation.
@@ -40,6 +168,18 @@ class VolatilityHarvester:
         self.adaptive = adaptive
         self.min_swing_pct = min_swing_pct or settings.min_swing_pct
         self.max_swing_pct = max_swing_pct or settings.max_swing_pct
+        self._min_swing_f = float(self.min_swing_pct)
+        self._max_swing_f = float(self.max_swing_pct)
+        # Callers that feed closed candles through on_new_candle get O(1)
+        # ATR/trend reads in generate_signal; until the windows are warm,
+        # generate_signal falls back to the DataFrame recompute path
+        self.indicators = IndicatorState(
+            settings_fast.atr_period, settings_fast.ma_short, settings_fast.ma_long
+        )
+
+    def on_new_candle(self, high: float, low: float, close: float):
+        """Fold a closed candle into the incremental indicator windows."""
+        self.indicators.update(high, low, close)
 
     def calculate_atr_pct(self, candles: pd.DataFrame, period: int = 14) -> Decimal:
         """
@@ -55,22 +195,18 @@ class VolatilityHarvester:
         if len(candles) < period + 1:
             return Decimal("0")
 
-        # Calculate True Range
-        high_low = candles['high'] - candles['low']
-        high_close = np.abs(candles['high'] - candles['close'].shift())
-        low_close = np.abs(candles['low'] - candles['close'].shift())
-
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-
-        # Calculate ATR
-        atr = true_range.rolling(window=period).mean().iloc[-1]
-        current_price = candles['close'].iloc[-1]
-
-        if current_price == 0:
-            return Decimal("0")
-
-        atr_pct = (atr / current_price) * 100
+        # One vectorized pass over float64 arrays instead of the pandas
+        # shift/concat/rolling pipeline, which allocated three Series and
+        # a DataFrame per call just to produce one scalar. Only the
+        # trailing period+1 bars matter, so slice before converting —
+        # bytes touched per call are O(period), not O(window)
+        n = period + 1
+        atr_pct = _atr_from_arrays(
+            candles['high'].iloc[-n:].to_numpy(dtype=np.float64),
+            candles['low'].iloc[-n:].to_numpy(dtype=np.float64),
+            candles['close'].iloc[-n:].to_numpy(dtype=np.float64),
+            period
+        )
         return Decimal(str(atr_pct))
 
     def adapt_thresholds(self, atr_pct: Decimal) -> Tuple[Decimal, Decimal]:
@@ -91,30 +227,19 @@ class VolatilityHarvester:
         if not self.adaptive:
             return (self.buy_threshold_pct, self.sell_threshold_pct)
 
-        # Map ATR to threshold range
-        # ATR 2% -> min_swing
-        # ATR 6% -> max_swing
-        atr_min = Decimal("2.0")
-        atr_max = Decimal("6.0")
-
-        if atr_pct <= atr_min:
-            adapted_threshold = self.min_swing_pct
-        elif atr_pct >= atr_max:
-            adapted_threshold = self.max_swing_pct
-        else:
-            # Linear interpolation
-            ratio = (atr_pct - atr_min) / (atr_max - atr_min)
-            adapted_threshold = self.min_swing_pct + ratio * (self.max_swing_pct - self.min_swing_pct)
-
-        # Keep buy and sell thresholds proportional
-        buy_threshold = adapted_threshold
-        sell_threshold = adapted_threshold
+        # Map ATR to threshold range (ATR 2% -> min_swing, 6% -> max_swing)
+        # through the bucketed cache; buy and sell stay proportional
+        adapted_threshold = _adapted_threshold(
+            int(float(atr_pct) * 100), self._min_swing_f, self._max_swing_f
+        )
 
-        logger.debug(f"ATR: {atr_pct:.2f}% -> Thresholds: Buy={buy_threshold:.2f}%, Sell={sell_threshold:.2f}%")
+        # Guarded: two Decimal __format__ calls per tick otherwise
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"ATR: {atr_pct:.2f}% -> Thresholds: Buy={adapted_threshold:.2f}%, Sell={adapted_threshold:.2f}%")
 
-        return (buy_threshold, sell_threshold)
+        return (adapted_threshold, adapted_threshold)
 
-    def check_trend_filter(self, candles: pd.DataFrame) -> bool:
+    def check_trend_filter(self, candles: Optional[pd.DataFrame]) -> bool:
         """
         Check trend filter (MA crossover).
 
@@ -124,13 +249,17 @@ class VolatilityHarvester:
         if not settings.use_trend_filter:
             return True
 
-        if len(candles) < settings.ma_long:
-            return True  # Not enough data, allow trading
+        # Warm incremental windows answer in O(1)
+        if self.indicators.trend_ready:
+            return self.indicators.trend_up
 
-        ma_short = candles['close'].rolling(window=settings.ma_short).mean().iloc[-1]
-        ma_long = candles['close'].rolling(window=settings.ma_long).mean().iloc[-1]
+        if candles is None or len(candles) < settings.ma_long:
+            return True  # Not enough data, allow trading
 
-        return ma_short > ma_long
+        # Tail means over the close column — rolling(N).mean().iloc[-1]
+        # built a full-length Series just to read its last element
+        close = candles['close'].to_numpy(dtype=np.float64)
+        return close[-settings_fast.ma_short:].mean() > close[-settings_fast.ma_long:].mean()
 
     def generate_signal(
         self,
@@ -152,10 +281,30 @@ class VolatilityHarvester:
         current_price = market_data.mid
         timestamp = market_data.timestamp
 
-        # Calculate ATR if candles provided
+        # Read the indicators incrementally when the windows are warm;
+        # otherwise one fused pass over the DataFrame columns yields ATR
+        # and both trend MAs together
         atr_pct = None
-        if candles is not None and len(candles) >= 15:
-            atr_pct = self.calculate_atr_pct(candles)
+        trend_ok = None
+        if self.indicators.atr_ready:
+            atr_pct = Decimal(str(self.indicators.atr_pct))
+        elif candles is not None and len(candles) > settings_fast.atr_period:
+            # Convert only the tails the indicators actually read
+            n_atr = settings_fast.atr_period + 1
+            n_close = max(n_atr, settings_fast.ma_long)
+            atr_f, ma_short, ma_long = _atr_ma_scan(
+                candles['high'].iloc[-n_atr:].to_numpy(dtype=np.float64),
+                candles['low'].iloc[-n_atr:].to_numpy(dtype=np.float64),
+                candles['close'].iloc[-n_close:].to_numpy(dtype=np.float64),
+                settings_fast.atr_period,
+                settings_fast.ma_short,
+                settings_fast.ma_long
+            )
+            atr_pct = Decimal(str(atr_f))
+            if settings_fast.use_trend_filter and len(candles) >= settings_fast.ma_long:
+                trend_ok = ma_short > ma_long
+
+        if atr_pct is not None:
             state.atr_pct = atr_pct
 
             # Adapt thresholds
@@ -175,8 +324,10 @@ class VolatilityHarvester:
                 reason=f"Paused: {state.pause_reason}"
             )
 
-        # Check trend filter
-        if candles is not None and not self.check_trend_filter(candles):
+        # Check trend filter (already decided above on the fused path)
+        if trend_ok is None:
+            trend_ok = self.check_trend_filter(candles)
+        if not trend_ok:
             return Signal(
                 timestamp=timestamp,
                 signal_type=SignalType.HOLD.value,
@@ -184,26 +335,36 @@ class VolatilityHarvester:
                 reason="Trend filter: bearish trend"
             )
 
-        # State machine logic
+        # State machine logic. The per-tick branch runs on float shadows
+        # of peak/trough/entry (0.0 = unsynced, seeded from the Decimal
+        # field); the Decimal fields are only written when the tracked
+        # price actually moves or a signal fires.
+        price_f = float(current_price)
+
         if state.state == StrategyState.FLAT:
             # Looking for buy opportunity (dip)
             # Track peak price
-            if state.last_peak is None or current_price > state.last_peak:
+            peak_f = state.last_peak_f
+            if not peak_f and state.last_peak is not None:
+                peak_f = float(state.last_peak)
+                state.last_peak_f = peak_f
+            if not peak_f or price_f > peak_f:
                 state.last_peak = current_price
-                logger.debug(f"New peak: {state.last_peak}")
+                state.last_peak_f = peak_f = price_f
+                logger.debug("New peak: %s", current_price)
 
             # Check if price dropped enough from peak
-            drop_pct = ((state.last_peak - current_price) / state.last_peak) * Decimal("100")
+            drop_pct = (peak_f - price_f) / peak_f * 100.0
 
-            if drop_pct >= buy_threshold:
+            if drop_pct >= float(buy_threshold):
                 return Signal(
                     timestamp=timestamp,
                     signal_type=SignalType.BUY.value,
                     price=current_price,
-                    reason=f"Price dropped {drop_pct:.2f}% from peak ${state.last_peak:.2f}",
+                    reason=f"Price dropped {drop_pct:.2f}% from peak ${peak_f:.2f}",
                     metadata={
-                        "drop_pct": float(drop_pct),
-                        "peak_price": float(state.last_peak),
+                        "drop_pct": drop_pct,
+                        "peak_price": peak_f,
                         "buy_threshold": float(buy_threshold),
                         "atr_pct": float(atr_pct) if atr_pct else None
                     }
@@ -212,9 +373,14 @@ class VolatilityHarvester:
         elif state.state == StrategyState.LONG:
             # Looking for sell opportunity (rebound)
             # Track trough price
-            if state.last_trough is None or current_price < state.last_trough:
+            trough_f = state.last_trough_f
+            if not trough_f and state.last_trough is not None:
+                trough_f = float(state.last_trough)
+                state.last_trough_f = trough_f
+            if not trough_f or price_f < trough_f:
                 state.last_trough = current_price
-                logger.debug(f"New trough: {state.last_trough}")
+                state.last_trough_f = price_f
+                logger.debug("New trough: %s", current_price)
 
             # Check if price rose enough from entry
             if state.last_buy_price is None:
@@ -226,17 +392,18 @@ class VolatilityHarvester:
                     reason="Missing buy price"
                 )
 
-            rise_pct = ((current_price - state.last_buy_price) / state.last_buy_price) * Decimal("100")
+            buy_price_f = state.last_buy_price_f or float(state.last_buy_price)
+            rise_pct = (price_f - buy_price_f) / buy_price_f * 100.0
 
-            if rise_pct >= sell_threshold:
+            if rise_pct >= float(sell_threshold):
                 return Signal(
                     timestamp=timestamp,
                     signal_type=SignalType.SELL.value,
                     price=current_price,
-                    reason=f"Price rose {rise_pct:.2f}% from entry ${state.last_buy_price:.2f}",
+                    reason=f"Price rose {rise_pct:.2f}% from entry ${buy_price_f:.2f}",
                     metadata={
-                        "rise_pct": float(rise_pct),
-                        "entry_price": float(state.last_buy_price),
+                        "rise_pct": rise_pct,
+                        "entry_price": buy_price_f,
                         "sell_threshold": float(sell_threshold),
                         "atr_pct": float(atr_pct) if atr_pct else None
                     }
@@ -250,6 +417,99 @@ class VolatilityHarvester:
             reason="No trigger met"
         )
 
+    # Codes emitted by generate_signals_batch
+    HOLD_CODE = 0
+    BUY_CODE = 1
+    SELL_CODE = 2
+
+    def generate_signals_batch(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Generate signals for a whole candle series at once.
+
+        Backtests call generate_signal per bar, re-deriving ATR and
+        thresholds from a DataFrame window and allocating a Signal object
+        every iteration. This precomputes the rolling ATR and per-bar
+        thresholds vectorized, then walks the FLAT/LONG state machine
+        over plain floats, emitting one int8 code per bar
+        (0=hold, 1=buy, 2=sell). Fill simulation and PnL accounting stay
+        with the caller.
+
+        Buys fire on a drop from the running peak, sells on a rise from
+        the entry price, mirroring generate_signal with the close as the
+        tick price.
+        """
+        n = len(closes)
+        codes = np.zeros(n, dtype=np.int8)
+        if n == 0:
+            return codes
+
+        period = settings_fast.atr_period
+        buy_thr = np.full(n, float(self.buy_threshold_pct))
+        sell_thr = np.full(n, float(self.sell_threshold_pct))
+
+        if self.adaptive and n > period:
+            # Rolling ATR% per bar, defined from bar `period` onwards
+            prev_close = closes[:-1]
+            tr = np.maximum(
+                highs[1:] - lows[1:],
+                np.maximum(np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close))
+            )
+            atr = np.convolve(tr, np.full(period, 1.0 / period), mode="valid")
+            atr_pct = atr / closes[period:] * 100.0
+
+            # Same linear map as adapt_thresholds: ATR 2% -> min swing,
+            # ATR 6% -> max swing
+            min_swing = float(self.min_swing_pct)
+            max_swing = float(self.max_swing_pct)
+            ratio = np.clip((atr_pct - 2.0) / 4.0, 0.0, 1.0)
+            adapted = min_swing + ratio * (max_swing - min_swing)
+            buy_thr[period:] = adapted
+            sell_thr[period:] = adapted
+
+        # Optional trend gate: short MA above long MA, per bar
+        trend_ok = None
+        ma_long_n = settings_fast.ma_long
+        if settings_fast.use_trend_filter and n >= ma_long_n:
+            ma_short_n = settings_fast.ma_short
+            csum = np.concatenate(([0.0], np.cumsum(closes)))
+            ma_short = (csum[ma_short_n:] - csum[:-ma_short_n]) / ma_short_n
+            ma_long = (csum[ma_long_n:] - csum[:-ma_long_n]) / ma_long_n
+            trend_ok = np.ones(n, dtype=bool)
+            trend_ok[ma_long_n - 1:] = ma_short[ma_long_n - ma_short_n:] > ma_long
+
+        close_list = closes.tolist()
+        buy_list = buy_thr.tolist()
+        sell_list = sell_thr.tolist()
+
+        long_state = False
+        peak = close_list[0]
+        buy_price = 0.0
+
+        for i in range(n):
+            price = close_list[i]
+            if long_state:
+                if (price - buy_price) / buy_price * 100.0 >= sell_list[i]:
+                    codes[i] = self.SELL_CODE
+                    long_state = False
+                    peak = price
+            else:
+                if price > peak:
+                    peak = price
+                elif (
+                    (peak - price) / peak * 100.0 >= buy_list[i]
+                    and (trend_ok is None or trend_ok[i])
+                ):
+                    codes[i] = self.BUY_CODE
+                    long_state = True
+                    buy_price = price
+
+        return codes
+
     def update_state_after_buy(
         self,
         state: StrategyStateData,
@@ -260,10 +520,12 @@ class VolatilityHarvester:
         """Update state after buy execution."""
         state.state = StrategyState.LONG
         state.last_buy_price = fill_price
+        state.last_buy_price_f = float(fill_price)
         state.current_position_qty = qty
         state.last_trough = fill_price  # Reset trough to entry price
+        state.last_trough_f = state.last_buy_price_f
         state.last_update = timestamp
-        logger.info(f"Entered LONG position at ${fill_price} qty={qty}")
+        logger.info("Entered LONG position at $%s qty=%s", fill_price, qty)
 
     def update_state_after_sell(
         self,
@@ -278,6 +540,7 @@ class VolatilityHarvester:
         state.current_position_qty = Decimal("0")
         state.realized_pnl += realized_pnl
         state.last_peak = fill_price  # Reset peak to exit price
+        state.last_peak_f = float(fill_price)
         state.last_update = timestamp
 
         # Track win/loss streak
@@ -291,7 +554,7 @@ class VolatilityHarvester:
 
         state.total_trades += 1
 
-        logger.info(f"Exited position at ${fill_price}, PnL=${realized_pnl:.2f}")
+        logger.info("Exited position at $%s, PnL=$%.2f", fill_price, realized_pnl)
 
     def calculate_position_size(
         self,
@@ -4,11 +4,32 @@ Candles repository for database operations.
 from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+import numpy as np
 import pandas as pd
 from app.core.models import Candle
 
 
+def _candle_mappings(candles: List[Candle]) -> List[dict]:
+    """Flatten Candle objects into plain row dicts for bulk inserts."""
+    return [
+        {
+            "symbol": c.symbol,
+            "ts": c.ts,
+            "open": c.open,
+            "high": c.high,
+            "low": c.low,
+            "close": c.close,
+            "volume": c.volume,
+            "source": c.source,
+            "timeframe": c.timeframe
+        }
+        for c in candles
+    ]
+
+
 class CandlesRepository:
     """Repository for candle data operations."""
 
@@ -43,6 +64,81 @@ class CandlesRepository:
 
         return query.all()
 
+    def iter_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ):
+        """
+        Stream candles in ts order without materializing the range.
+
+        yield_per fetches rows in fixed-size server batches, so walking a
+        multi-million-row backfill stays flat in memory where get_candles
+        holds every ORM object at once. Callers that want a DataFrame
+        should use get_candles_df instead.
+        """
+        query = self.db.query(Candle).filter(
+            and_(
+                Candle.symbol == symbol,
+                Candle.timeframe == timeframe
+            )
+        )
+
+        if start:
+            query = query.filter(Candle.ts >= start)
+        if end:
+            query = query.filter(Candle.ts <= end)
+
+        return query.order_by(Candle.ts).yield_per(5000)
+
+    def get_candles_df(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Load candles straight into a float64 DataFrame.
+
+        A Core select over the six needed columns skips ORM object
+        hydration entirely — get_candles + candles_to_dataframe would
+        instantiate one instrumented Candle per row and then walk each
+        attribute again to build the columns.
+        """
+        stmt = select(
+            Candle.ts, Candle.open, Candle.high,
+            Candle.low, Candle.close, Candle.volume
+        ).where(
+            Candle.symbol == symbol,
+            Candle.timeframe == timeframe
+        )
+
+        if start:
+            stmt = stmt.where(Candle.ts >= start)
+        if end:
+            stmt = stmt.where(Candle.ts <= end)
+
+        stmt = stmt.order_by(Candle.ts)
+
+        if limit:
+            stmt = stmt.limit(limit)
+
+        rows = self.db.execute(stmt).all()
+
+        if not rows:
+            return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+
+        df = pd.DataFrame(rows, columns=["timestamp", "open", "high", "low", "close", "volume"])
+        # Numeric columns arrive as Decimal; indicator math needs float64
+        for col in ("open", "high", "low", "close", "volume"):
+            df[col] = df[col].astype(np.float64)
+        df.set_index("timestamp", inplace=True)
+        return df
+
     def get_latest_candle(self, symbol: str, timeframe: str) -> Optional[Candle]:
         """Get most recent candle."""
         return self.db.query(Candle).filter(
@@ -57,16 +153,35 @@ class CandlesRepository:
         if not candles:
             return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
 
-        data = {
-            "timestamp": [c.ts for c in candles],
-            "open": [c.open for c in candles],
-            "high": [c.high for c in candles],
-            "low": [c.low for c in candles],
-            "close": [c.close for c in candles],
-            "volume": [c.volume for c in candles]
-        }
+        # Fill preallocated float64 columns in one pass; pandas wraps
+        # the arrays without re-scanning boxed-float lists for dtype
+        # inference and copying them into blocks
+        n = len(candles)
+        ts = np.empty(n, dtype="datetime64[ns]")
+        opens = np.empty(n)
+        highs = np.empty(n)
+        lows = np.empty(n)
+        closes = np.empty(n)
+        volumes = np.empty(n)
+        for i, c in enumerate(candles):
+            ts[i] = c.ts
+            opens[i] = float(c.open)
+            highs[i] = float(c.high)
+            lows[i] = float(c.low)
+            closes[i] = float(c.close)
+            volumes[i] = float(c.volume)
 
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(
+            {
+                "timestamp": ts,
+                "open": opens,
+                "high": highs,
+                "low": lows,
+                "close": closes,
+                "volume": volumes
+            },
+            copy=False
+        )
         df.set_index("timestamp", inplace=True)
         return df
 
@@ -75,7 +190,72 @@ class CandlesRepository:
         self.db.add(candle)
         self.db.commit()
 
+    # Rows per executemany batch for very large backfills
+    _INSERT_CHUNK = 1000
+
     def bulk_insert_candles(self, candles: List[Candle]):
-        """Bulk insert candles."""
-        self.db.bulk_save_objects(candles)
+        """
+        Bulk insert candles.
+
+        bulk_insert_mappings over plain row dicts skips ORM instance
+        state and per-row unit-of-work bookkeeping that bulk_save_objects
+        still pays; large batches go out as chunked executemany calls.
+        """
+        if not candles:
+            return
+        mappings = _candle_mappings(candles)
+        for i in range(0, len(mappings), self._INSERT_CHUNK):
+            self.db.bulk_insert_mappings(Candle, mappings[i:i + self._INSERT_CHUNK])
+        self.db.commit()
+
+    def _filter_existing(self, candles: List[Candle]) -> List[Candle]:
+        """
+        Drop candles already stored, with one range query per
+        (symbol, timeframe) in the batch rather than a probe per row:
+        fetch every stored ts inside the batch's span, build a set, and
+        filter in memory.
+        """
+        spans: dict = {}
+        for c in candles:
+            key = (c.symbol, c.timeframe)
+            lo, hi = spans.get(key, (c.ts, c.ts))
+            spans[key] = (min(lo, c.ts), max(hi, c.ts))
+
+        existing = set()
+        for (symbol, timeframe), (lo, hi) in spans.items():
+            rows = self.db.execute(
+                select(Candle.ts).where(
+                    Candle.symbol == symbol,
+                    Candle.timeframe == timeframe,
+                    Candle.ts.between(lo, hi)
+                )
+            )
+            existing.update((symbol, timeframe, ts) for (ts,) in rows)
+
+        return [c for c in candles if (c.symbol, c.timeframe, c.ts) not in existing]
+
+    def insert_candles_ignore_duplicates(self, candles: List[Candle]):
+        """
+        Idempotent bulk insert for WS backfills: rows that collide with
+        existing candles are skipped by the database (ON CONFLICT DO
+        NOTHING / INSERT OR IGNORE) instead of raising. Dialects without
+        a conflict clause get one range query over the batch's ts span
+        to drop already-stored rows before a plain insert — still a
+        single dedup roundtrip rather than one probe per candle.
+        """
+        if not candles:
+            return
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = pg_insert(Candle).on_conflict_do_nothing()
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(Candle).on_conflict_do_nothing()
+        else:
+            stmt = insert(Candle)
+            candles = self._filter_existing(candles)
+            if not candles:
+                return
+        mappings = _candle_mappings(candles)
+        for i in range(0, len(mappings), self._INSERT_CHUNK):
+            self.db.execute(stmt, mappings[i:i + self._INSERT_CHUNK])
         self.db.commit()
@@ -1,18 +1,27 @@
 """
 Data ingestion - fetch and store OHLCV candles.
 """
+import asyncio
 from datetime import datetime, timedelta
 from typing import List, Optional
+import numpy as np
 import pandas as pd
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.adapters.exchange_base import ExchangeAdapter
 from app.core.models import Candle
+from app.data.candles_repo import CandlesRepository
 from app.db.database import get_db_context
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Rows per cursor batch when loading candles; one chunk bounds peak
+# memory during multi-year loads instead of the whole result set
+_READ_CHUNK = 50_000
+
+
 class DataIngester:
     """
     Fetches OHLCV data from exchanges and stores in database.
@@ -81,25 +90,21 @@ class DataIngester:
             return
 
         try:
-            # Bulk insert (skip duplicates)
-            for candle in candles:
-                # Check if exists
-                existing = db.query(Candle).filter(
-                    Candle.symbol == candle.symbol,
-                    Candle.ts == candle.ts,
-                    Candle.timeframe == candle.timeframe
-                ).first()
-
-                if not existing:
-                    db.add(candle)
-
-            db.commit()
+            # Single bulk INSERT; the database skips rows that collide
+            # with the unique (symbol, timeframe, ts) index, replacing
+            # the old one-SELECT-per-candle existence probe
+            CandlesRepository(db).insert_candles_ignore_duplicates(candles)
             logger.info(f"Stored {len(candles)} candles")
 
         except Exception as e:
             logger.error(f"Failed to store candles: {e}")
             db.rollback()
 
+    def _store_sync(self, candles: List[Candle]):
+        """store_candles with its own short-lived session, for worker threads."""
+        with get_db_context() as db:
+            self.store_candles(candles, db)
+
     async def backfill_candles(
         self,
         timeframe: str,
@@ -109,6 +114,12 @@ class DataIngester:
         """
         Backfill historical candles.
 
+        Fetch and store run as a two-stage pipeline: a producer task
+        pages through the exchange while the consumer writes the
+        previous batch, so HTTP latency and DB commit time overlap
+        instead of alternating. The bounded queue backpressures the
+        fetcher when the database falls behind.
+
         Args:
             timeframe: Candle timeframe
             start_date: Start date
@@ -119,33 +130,50 @@ class DataIngester:
 
         logger.info(f"Backfilling {timeframe} candles from {start_date} to {end_date}")
 
-        # Fetch in chunks
         chunk_size = 1000
-        current_date = start_date
-
+        queue: asyncio.Queue = asyncio.Queue(maxsize=4)
         total_fetched = 0
 
-        while current_date < end_date:
-            candles = await self.fetch_candles(
-                timeframe=timeframe,
-                since=current_date,
-                limit=chunk_size
-            )
+        async def producer():
+            # Paging is inherently serial — the next `since` comes from
+            # the previous batch's last timestamp — so prefetch depth,
+            # not request concurrency, is what the pipeline buys
+            current_date = start_date
+            while current_date < end_date:
+                candles = await self.fetch_candles(
+                    timeframe=timeframe,
+                    since=current_date,
+                    limit=chunk_size
+                )
 
-            if not candles:
+                if not candles:
+                    break
+
+                await queue.put(candles)
+
+                # Move to next chunk
+                last_ts = candles[-1].ts
+                current_date = last_ts + timedelta(minutes=1)
+
+                # Avoid rate limits
+                await asyncio.sleep(0.5)
+
+            await queue.put(None)
+
+        producer_task = asyncio.create_task(producer())
+
+        while True:
+            candles = await queue.get()
+            if candles is None:
                 break
 
-            with get_db_context() as db:
-                self.store_candles(candles, db)
+            # The commit runs on a worker thread so the event loop keeps
+            # fetching while the database fsyncs
+            await asyncio.to_thread(self._store_sync, candles)
 
             total_fetched += len(candles)
 
-            # Move to next chunk
-            last_ts = candles[-1].ts
-            current_date = last_ts + timedelta(minutes=1)
-
-            # Avoid rate limits
-            await asyncio.sleep(0.5)
+        await producer_task
 
         logger.info(f"Backfill complete: {total_fetched} candles fetched")
 
@@ -169,34 +197,44 @@ class DataIngester:
             DataFrame with columns [timestamp, open, high, low, close, volume]
         """
         def _load(session: Session) -> pd.DataFrame:
-            query = session.query(Candle).filter(
+            # Core select straight into pandas: read_sql builds the
+            # columns from the cursor, skipping the ORM Candle per row
+            # and the per-column list comprehensions the old path paid
+            stmt = select(
+                Candle.ts, Candle.open, Candle.high,
+                Candle.low, Candle.close, Candle.volume
+            ).where(
                 Candle.symbol == self.symbol,
                 Candle.timeframe == timeframe
             )
 
             if start_date:
-                query = query.filter(Candle.ts >= start_date)
+                stmt = stmt.where(Candle.ts >= start_date)
             if end_date:
-                query = query.filter(Candle.ts <= end_date)
+                stmt = stmt.where(Candle.ts <= end_date)
 
-            query = query.order_by(Candle.ts)
+            stmt = stmt.order_by(Candle.ts)
 
-            candles = query.all()
+            # chunksize streams the cursor in fixed-size batches, so a
+            # multi-year load peaks at one chunk of rows instead of
+            # holding the raw rows and the DataFrame at once
+            frames = [
+                chunk for chunk
+                in pd.read_sql(stmt, session.get_bind(), chunksize=_READ_CHUNK)
+                if not chunk.empty
+            ]
 
-            if not candles:
+            if not frames:
                 logger.warning(f"No candles found for {self.symbol} {timeframe}")
                 return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
 
-            data = {
-                "timestamp": [c.ts for c in candles],
-                "open": [c.open for c in candles],
-                "high": [c.high for c in candles],
-                "low": [c.low for c in candles],
-                "close": [c.close for c in candles],
-                "volume": [c.volume for c in candles]
-            }
+            df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True, copy=False)
 
-            return pd.DataFrame(data)
+            df.rename(columns={"ts": "timestamp"}, inplace=True)
+            # Numeric columns arrive as Decimal; indicator math needs float64
+            for col in ("open", "high", "low", "close", "volume"):
+                df[col] = df[col].astype(np.float64)
+            return df
 
         if db:
             return _load(db)
@@ -204,6 +242,3 @@ class DataIngester:
             with get_db_context() as session:
                 return _load(session)
 
-
-# Async import
-import asyncio
@@ -7,16 +7,25 @@ from contextlib import contextmanager
 from typing import Generator
 from app.core.config import settings
 from app.core.models import Base
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON column values with orjson instead of stdlib json."""
+    return orjson.dumps(obj).decode()
+
+
 # Create engine
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     echo=settings.log_level == "DEBUG"
 )
 
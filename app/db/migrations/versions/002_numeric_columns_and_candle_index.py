@@ -0,0 +1,90 @@
+"""Numeric money columns, jsonb storage, composite candles index
+
+Brings databases created by revision 001 in line with the current
+models: money columns move from Float to Numeric(18, 8), JSON columns
+move to jsonb, and the two single-column candle indexes are replaced
+by one unique composite (symbol, timeframe, ts) index that serves the
+hot range queries and enforces candle dedup at the DB level.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-08-27 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+# Every Float money column that the models now declare as Numeric(18, 8)
+_NUMERIC_COLUMNS = (
+    ('positions', 'entry_price', False),
+    ('positions', 'exit_price', True),
+    ('positions', 'qty', False),
+    ('positions', 'realized_pnl', True),
+    ('positions', 'fees_paid', False),
+    ('trades', 'qty', False),
+    ('trades', 'price', False),
+    ('trades', 'fee', False),
+    ('trades', 'pnl', True),
+    ('orders', 'qty', False),
+    ('orders', 'price', True),
+    ('orders', 'filled_qty', False),
+    ('orders', 'filled_price', True),
+    ('candles', 'open', False),
+    ('candles', 'high', False),
+    ('candles', 'low', False),
+    ('candles', 'close', False),
+    ('candles', 'volume', False),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in _NUMERIC_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Numeric(18, 8),
+            existing_nullable=nullable
+        )
+
+    op.alter_column(
+        'runs', 'config_json',
+        type_=JSONB(),
+        existing_nullable=False,
+        postgresql_using='config_json::jsonb'
+    )
+    op.alter_column(
+        'state', 'value_json',
+        type_=JSONB(),
+        existing_nullable=False,
+        postgresql_using='value_json::jsonb'
+    )
+
+    # Composite index serves WHERE symbol=? AND timeframe=? AND ts range
+    # ORDER BY ts queries; unique so duplicate candles are rejected at
+    # the DB level and idempotent inserts can ON CONFLICT DO NOTHING
+    op.drop_index(op.f('ix_candles_symbol'), table_name='candles')
+    op.drop_index(op.f('ix_candles_ts'), table_name='candles')
+    op.create_index('ix_candles_symbol_tf_ts', 'candles', ['symbol', 'timeframe', 'ts'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candles_symbol_tf_ts', table_name='candles')
+    op.create_index(op.f('ix_candles_symbol'), 'candles', ['symbol'], unique=False)
+    op.create_index(op.f('ix_candles_ts'), 'candles', ['ts'], unique=False)
+
+    op.alter_column('state', 'value_json', type_=JSON(), existing_nullable=False)
+    op.alter_column('runs', 'config_json', type_=JSON(), existing_nullable=False)
+
+    for table, column, nullable in reversed(_NUMERIC_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.Float(),
+            existing_nullable=nullable
+        )
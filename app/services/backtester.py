@@ -18,6 +18,7 @@ from app.core.fees import calculate_trading_fee
 from app.core.slippage import adjust_fill_price_for_slippage
 from app.core.config import settings
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,27 @@ class BacktestConfig:
     maker_fill_rate: float = 0.7  # 70% of orders fill as maker
     reserve_pct: Decimal = Decimal("8.0")
 
+    _DECIMAL_FIELDS = (
+        "initial_capital", "buy_threshold_pct", "sell_threshold_pct",
+        "min_swing_pct", "max_swing_pct", "maker_fee_pct",
+        "taker_fee_pct", "reserve_pct"
+    )
+
+    @classmethod
+    def from_floats(cls, **kwargs) -> "BacktestConfig":
+        """
+        Build a config from plain floats (e.g. an API request body).
+
+        Centralizes the Decimal(str(x)) boundary conversion so callers in
+        parameter-sweep mode pass floats straight through instead of
+        wrapping each field themselves.
+        """
+        converted = {
+            k: (Decimal(str(v)) if k in cls._DECIMAL_FIELDS and not isinstance(v, Decimal) else v)
+            for k, v in kwargs.items()
+        }
+        return cls(**converted)
+
 
 @dataclass
 class BacktestResult:
@@ -141,9 +163,10 @@ class Backtester:
             atr_pct = self.strategy.calculate_atr_pct(recent_candles)
             state.atr_pct = atr_pct
 
-            # Check circuit breakers (simplified for backtest)
+            # Check circuit breakers (simplified for backtest; historical data
+            # is never stale, so feed a fresh monotonic heartbeat)
             should_pause, cb_reason, reason = self.risk_manager.check_all_circuit_breakers(
-                state, market_data, timestamp
+                state, market_data, time.monotonic()
             )
 
             if should_pause and not state.paused:
@@ -211,20 +234,20 @@ class Backtester:
                     notional = qty * fill_price
                     fee = calculate_trading_fee(notional, is_maker)
 
-                    # Calculate realized PnL
+                    # Calculate realized PnL (all Decimal, matching paper_trader)
                     entry_cost = state.last_buy_price * qty
                     exit_revenue = fill_price * qty - fee
-                    realized_pnl = exit_revenue - float(entry_cost)
+                    realized_pnl = exit_revenue - entry_cost
 
                     # Execute
                     try:
                         portfolio.execute_sell(qty, fill_price, fee)
 
                         # Update state
-                        self.strategy.update_state_after_sell(state, fill_price, Decimal(str(realized_pnl)), timestamp)
+                        self.strategy.update_state_after_sell(state, fill_price, realized_pnl, timestamp)
 
                         # Track daily PnL for risk management
-                        self.risk_manager.update_daily_pnl(Decimal(str(realized_pnl)))
+                        self.risk_manager.update_daily_pnl(realized_pnl)
 
                         # Record trade
                         trades.append({
@@ -234,7 +257,7 @@ class Backtester:
                             "price": float(fill_price),
                             "fee": float(fee),
                             "is_maker": is_maker,
-                            "pnl": realized_pnl,
+                            "pnl": float(realized_pnl),
                             "reason": signal.reason
                         })
 
@@ -16,6 +16,7 @@ from app.core.models import StrategyStateData
 from app.core.enums import StrategyState
 from app.data.ingest import DataIngester
 from app.core.config import settings
+from app.core import metrics_buf
 import logging
 
 logger = logging.getLogger(__name__)
@@ -99,6 +100,7 @@ class LiveTrader:
         """Stop live trading."""
         logger.warning("Stopping live trader...")
         self.running = False
+        metrics_buf.clear()
         await self.exchange.disconnect()
         logger.info("Live trader stopped")
 
@@ -144,7 +146,8 @@ class LiveTrader:
 
                 # Check circuit breakers
                 should_pause, cb_reason, reason = self.risk_manager.check_all_circuit_breakers(
-                    self.state, market_data, self.exchange.last_heartbeat
+                    self.state, market_data, self.exchange.last_heartbeat,
+                    now=market_data.timestamp
                 )
 
                 if should_pause and not self.state.paused:
@@ -176,6 +179,9 @@ class LiveTrader:
                            f"Equity: ${self.state.total_equity:.2f}, "
                            f"BTC: {self.portfolio.btc:.8f}, Price: ${market_data.mid:.2f}")
 
+                # Publish metrics so /metrics scrapes never call into us
+                metrics_buf.publish(self.get_status())
+
             except Exception as e:
                 logger.error(f"Trading loop error: {e}", exc_info=True)
 
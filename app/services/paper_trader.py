@@ -15,6 +15,7 @@ from app.core.models import StrategyStateData, MarketData
 from app.core.enums import StrategyState
 from app.data.ingest import DataIngester
 from app.core.config import settings
+from app.core import metrics_buf
 import logging
 
 logger = logging.getLogger(__name__)
@@ -48,9 +49,9 @@ class PaperTrader:
         await self.exchange.connect()
         self.running = True
 
-        # Initialize balances
-        self.exchange.balances["USD"] = self.portfolio.cash
-        self.exchange.balances["BTC"] = self.portfolio.btc
+        # Initialize balances (FakeExchange keeps float internals)
+        self.exchange.balances["USD"] = float(self.portfolio.cash)
+        self.exchange.balances["BTC"] = float(self.portfolio.btc)
 
         logger.info(f"Paper trader started with ${self.portfolio.cash:.2f}")
 
@@ -61,6 +62,7 @@ class PaperTrader:
         """Stop paper trading."""
         logger.info("Stopping paper trader...")
         self.running = False
+        metrics_buf.clear()
         await self.exchange.disconnect()
 
     async def _trading_loop(self):
@@ -80,7 +82,8 @@ class PaperTrader:
 
                 # Check circuit breakers
                 should_pause, cb_reason, reason = self.risk_manager.check_all_circuit_breakers(
-                    self.state, market_data, self.exchange.last_heartbeat
+                    self.state, market_data, self.exchange.last_heartbeat,
+                    now=market_data.timestamp
                 )
 
                 if should_pause and not self.state.paused:
@@ -111,6 +114,9 @@ class PaperTrader:
                 logger.debug(f"State: {self.state.state.value}, Equity: ${self.state.total_equity:.2f}, "
                             f"BTC: {self.portfolio.btc:.8f}, Price: ${market_data.mid:.2f}")
 
+                # Publish metrics so /metrics scrapes never call into us
+                metrics_buf.publish(self.get_status())
+
             except Exception as e:
                 logger.error(f"Trading loop error: {e}", exc_info=True)
 
@@ -0,0 +1,68 @@
+"""
+Unit tests for backtester module.
+"""
+import pytest
+from decimal import Decimal
+from datetime import datetime, timedelta
+import pandas as pd
+import numpy as np
+from app.services.backtester import Backtester, BacktestConfig
+
+
+def make_oscillating_candles(n=400, base=50000.0, amplitude=0.06, period=40):
+    """
+    Synthetic 1m candles oscillating +/- amplitude around base.
+
+    The swings are wide enough to cross the buy/sell thresholds and the
+    per-bar ranges keep ATR inside the volatility circuit-breaker
+    bounds, so a backtest over them must complete round-trip trades.
+    """
+    t0 = datetime(2024, 1, 1)
+    i = np.arange(n)
+    close = base * (1 + amplitude * np.sin(2 * np.pi * i / period))
+    return pd.DataFrame({
+        "timestamp": [t0 + timedelta(minutes=int(k)) for k in i],
+        "open": close,
+        "high": close * 1.015,
+        "low": close * 0.985,
+        "close": close,
+        "volume": np.full(n, 10.0)
+    })
+
+
+class TestBacktester:
+    """Test Backtester engine."""
+
+    def test_run_completes_round_trip_trades(self):
+        """Smoke test: oscillating prices must produce buys and sells."""
+        config = BacktestConfig(
+            buy_threshold_pct=Decimal("3.0"),
+            sell_threshold_pct=Decimal("3.0"),
+            adaptive_thresholds=False
+        )
+        backtester = Backtester(config)
+
+        result = backtester.run(make_oscillating_candles())
+
+        sells = [t for t in result.trades if t["side"] == "sell"]
+        assert result.total_trades >= 1
+        assert len(sells) >= 1
+        # PnL flows through as plain floats into the trade record
+        assert all(isinstance(t["pnl"], float) for t in sells)
+        assert result.final_capital > 0
+
+    def test_result_accounting_is_consistent(self):
+        """Reported PnL must match final vs initial capital."""
+        config = BacktestConfig(adaptive_thresholds=False)
+        backtester = Backtester(config)
+
+        result = backtester.run(make_oscillating_candles())
+
+        assert result.total_pnl == pytest.approx(
+            result.final_capital - result.initial_capital
+        )
+        assert result.winning_trades + result.losing_trades <= result.total_trades
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])